@@ -1,22 +1,79 @@
 # Modified from enhanced_monitor.py
 
+import aiohttp
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from data_manager import DataManager
 from filing_scraper import FilingScraper
-from filing_status_manager import FilingStatusManager
+from filing_status_manager import FilingStatusManager, PendingFiling
 from notification_manager import NotificationManager, NotificationRequest, NotificationResponse
-from transaction_extractor import TradingDataExtractor
+from transaction_extractor import TradingDataExtractor, pool_mp_context
 import os
+import re
 import sys
-from typing import Dict, List
+import time
+from typing import Dict, Iterable, List, Optional
 
 
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import uvloop  # Optional: faster event loop for the concurrent downloads
+except ImportError:
+    uvloop = None
 
 
+# Error messages that indicate a filing will never parse, so it shouldn't be retried
+PERMANENT_ERROR_RE = re.compile(
+    "corrupted|invalid format|unsupported|malformed|no transactions found|"
+    "file not found|access denied|invalid pdf|permission denied",
+    re.IGNORECASE
+)
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop when it's installed, unless USE_UVLOOP is set to "false".
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None and os.getenv("USE_UVLOOP", "true").lower() != "false":
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+# Per-process extractor for _extract_worker, created on first use in each worker
+_worker_extractor = None
+
+
+def _extract_worker(pdf_bytes: bytes, pdf_url: str) -> Dict:
+    """
+    Extract trading data from a PDF inside an extraction worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor.
+
+    Args:
+        pdf_bytes: Contents of the downloaded PDF
+        pdf_url: URL the PDF was downloaded from
+
+    Returns:
+        Result dictionary from TradingDataExtractor.extract_trading_data
+    """
+    global _worker_extractor
+    if _worker_extractor is None:
+        # No page pool here: the extraction pool already keeps every core busy, and nothing
+        # would shut a per-worker page pool down
+        _worker_extractor = TradingDataExtractor(page_workers=0)
+    return _worker_extractor.extract_trading_data(pdf_bytes, pdf_url)
+
 
 class DailyRun:
     def __init__(self):
@@ -25,10 +82,23 @@ class DailyRun:
         self.status_manager = FilingStatusManager(self.data_manager)
         self.trading_data_extractor = TradingDataExtractor()
         self.notification_manager = NotificationManager()
+        # Process pool for CPU-bound extraction, alive only while PDFs are being processed
+        self._extract_pool: ProcessPoolExecutor|None = None
         
     
     def run(self):
+        # One timestamp for everything this run records
+        run_ts = datetime.now().isoformat()
+        # Set before anything can fail, so the notification check in finally never hits an
+        # unbound name and hides the real error
+        scrape_result = None
+
         try:
+            # Apply results journaled by a previous run that didn't finish
+            recovered_count = self.data_manager.commit_processed_journal(now=run_ts)
+            if recovered_count:
+                print(f"Recovered {recovered_count} processed filings from an interrupted run")
+
             # 1. Scrape the latest filings
             print("Step 1: Run Congressional Financial Disclosure Filing Scraper")
             scrape_result = self._run_scraper()
@@ -36,7 +106,7 @@ class DailyRun:
             
             # 2. Update trading database with new filings
             print("Step 2: Updating trading database")
-            self._update_trading_database()
+            self._update_trading_database(now=run_ts)
             print("✓ Trading database updated")
 
             # 3. Identify pending filings
@@ -47,7 +117,7 @@ class DailyRun:
             
             # 4. Process pending PDFs (with concurrent processing)
             print("Step 4: Processing pending PDFs")
-            extraction_result = self._process_pending_pdfs(pending_filings)
+            extraction_result = self._process_pending_pdfs(pending_filings, now=run_ts)
             print("✓ Pending PDFs processed")
 
         except Exception as e:
@@ -55,7 +125,7 @@ class DailyRun:
             raise
 
         finally:
-            if scrape_result["new_filings_count"] > 0:
+            if scrape_result and scrape_result["new_filings_count"] > 0:
                 try:
                     # Notify about new filings
                     # Send a notification with URL
@@ -79,6 +149,93 @@ class DailyRun:
         # TODO: Combine the outputs into a summary report
         return scrape_result
     
+    def process_incremental(self, pdf_urls: Optional[Iterable[str]] = None) -> Dict:
+        """
+        Process newly discovered filings without re-running the scraper.
+
+        Args:
+            pdf_urls: PDF URLs to process; None processes every pending filing
+
+        Returns:
+            Processing results summary
+        """
+        run_ts = datetime.now().isoformat()
+
+        self._update_trading_database(now=run_ts)
+        pending_filings = self.status_manager.identify_pending_filings()
+
+        if pdf_urls is not None:
+            wanted = set(pdf_urls)
+            pending_filings = [f for f in pending_filings if f.pdf_url in wanted]
+
+        return self._process_pending_pdfs(pending_filings, now=run_ts)
+
+    def serve(self, poll_interval: float|None = None, full_run_interval: float|None = None) -> None:
+        """
+        Watch congress_filings.json and process new filings as they appear.
+
+        Between changes each poll is a single stat() call. When the file changes
+        (e.g. a scraper run elsewhere wrote new filings) only the newly added
+        PDF URLs are processed. A full run() still happens every
+        full_run_interval seconds as a fallback and to scrape for new filings.
+
+        Args:
+            poll_interval: Seconds between file checks (WATCH_INTERVAL, default 30)
+            full_run_interval: Seconds between full runs (FULL_RUN_INTERVAL, default 3600)
+        """
+        if poll_interval is None:
+            poll_interval = float(os.getenv("WATCH_INTERVAL", 30))
+        if full_run_interval is None:
+            full_run_interval = float(os.getenv("FULL_RUN_INTERVAL", 3600))
+
+        last_full_run = float("-inf")
+        known_urls = frozenset()
+        signature = None
+
+        while True:
+            try:
+                if time.monotonic() - last_full_run >= full_run_interval:
+                    last_full_run = time.monotonic()
+                    self.run()
+                    known_urls = self.data_manager.get_existing_pdf_urls()
+                    signature = self.data_manager.get_congress_signature()
+
+                elif self.data_manager.get_congress_signature() != signature:
+                    current_urls = self.data_manager.get_existing_pdf_urls()
+                    new_urls = current_urls - known_urls
+                    if new_urls:
+                        print(f"Detected {len(new_urls)} new filings")
+                        self.process_incremental(new_urls)
+                    known_urls = current_urls
+                    # Processing rewrites the file, so re-read the signature afterwards
+                    signature = self.data_manager.get_congress_signature()
+
+            except Exception as e:
+                # Keep serving; the next full run retries anything left pending
+                print(f"Error in watch loop: {e}")
+
+            time.sleep(poll_interval)
+
+    def _skip_permanent_failures(self, filings: List[PendingFiling]) -> List[PendingFiling]:
+        """
+        Drop filings whose PDF already failed with a permanent error.
+
+        Args:
+            filings: Pending filings
+
+        Returns:
+            The filings that are still worth processing
+        """
+        permanent_failures = self.data_manager.get_permanent_failure_urls()
+        if not permanent_failures:
+            return filings
+
+        remaining = [f for f in filings if f.pdf_url not in permanent_failures]
+        skipped_count = len(filings) - len(remaining)
+        if skipped_count:
+            print(f"Skipping {skipped_count} filings that previously failed permanently")
+        return remaining
+
     def _run_scraper(self, force_full_scrape: bool = False) -> Dict:
         """
         Run the congressional filing scraper.
@@ -98,48 +255,50 @@ class DailyRun:
             return {"error": str(e)}
 
 
-    def _update_trading_database(self) -> None:
+    def _update_trading_database(self, now: str|None = None) -> None:
         """
         Update trading database with new filings.
         
         This identifies filings that need processing and adds them
         to the pending queue, marking their status appropriately.
+
+        Args:
+            now: ISO timestamp to record as discovered_at (defaults to the current time)
         """
-        # Get filings that need processing
-        pending_filings = self.status_manager.identify_pending_filings()
-        
-        # Mark filings as pending if they don't have status
-        pdf_urls = [f["pdf_url"] for f in pending_filings]
-                
-        # Add new filings to pending processing queue
-        added_count = 0
-        for filing_info in pending_filings:
-            # Create filing info for pending queue
-            pending_info = {
-                "member_name": filing_info["member_name"],
-                "pdf_id": filing_info["pdf_id"],
-                "pdf_url": filing_info["pdf_url"],
-                "filing_type": filing_info["filing_type"],
-                "year": filing_info["year"]
+        # Get filings that need processing, minus ones known to fail permanently
+        pending_filings = self._skip_permanent_failures(self.status_manager.identify_pending_filings())
+
+        # Add new filings to pending processing queue in a single write
+        pending_infos = [
+            {
+                "member_name": filing_info.member_name,
+                "pdf_id": filing_info.pdf_id,
+                "pdf_url": filing_info.pdf_url,
+                "filing_type": filing_info.filing_type,
+                "year": filing_info.year
             }
-            
-            if self.data_manager.add_pending_filing(pending_info):
-                added_count += 1
+            for filing_info in pending_filings
+        ]
+        added_count = self.data_manager.add_pending_filings_bulk(pending_infos, now=now)
 
         print(f"Added {added_count} new filings to pending processing queue")
 
 
 
-    def _process_pending_pdfs(self, pending_filings: List[Dict]) -> Dict:
+    def _process_pending_pdfs(self, pending_filings: List[PendingFiling], now: str|None = None) -> Dict:
         """
         Process pending PDF filings.
         
         Args:
-            pending_filings: List of pending filing dictionaries
+            pending_filings: Pending filings to process
+            now: ISO timestamp to record on processed/failed filings (defaults to the current time)
             
         Returns:
             Processing results summary
         """
+        # Don't spend this run's slots on filings that can never parse
+        pending_filings = self._skip_permanent_failures(pending_filings)
+
         if not pending_filings:
             print("No pending PDFs to process")
             return {"processed": 0, "successful": 0, "failed": 0}
@@ -152,86 +311,40 @@ class DailyRun:
         processed_count = 0
         successful_count = 0
         failed_count = 0
-        
-        try:
-            self.trading_data_extractor.create_temp_dir()
-            
-            for filing_info in files_to_process:
-                pdf_url = filing_info["pdf_url"]
-                pdf_id = filing_info["pdf_id"]
-                member_name = filing_info["member_name"]
-                
-                print(f"Processing: {member_name} - {pdf_id}")
-                
-                try:
-                    # Download PDF
-                    filename = f"{pdf_id}.pdf"
-                    pdf_path = self.trading_data_extractor.download_pdf(pdf_url, filename)
-                    
-                    if pdf_path:
-                        # Extract trading data
-                        result = self.trading_data_extractor.extract_trading_data(pdf_path)
-                        
-                        if result.get("error"):
-                            error_msg = result["error"]
-                            print(f"Error extracting data from {pdf_id}: {error_msg}")
-                            
-                            # Determine if this is a permanent error
-                            is_permanent = self._is_permanent_error(error_msg)
-                            self.data_manager.mark_filing_error(pdf_url, error_msg, is_permanent)
-                            
-                            if is_permanent:
-                                processed_count += 1
-                                failed_count += 1
-                        else:
-                            transaction_count = len(result.get("transactions", []))
-                            print(f"Found {transaction_count} transactions in {pdf_id}")
-                            
-                            # Mark as processed with results
-                            processing_result = {
-                                "pdf_url": pdf_url,
-                                "member_info": result.get("member_info", {}),
-                                "stock_transaction_count": transaction_count,
-                                "parsed_at": result.get("parsed_at", datetime.now().isoformat()),
-                                "transactions": result.get("transactions", [])
-                            }
-                            
-                            self.data_manager.mark_filing_processed(pdf_url, processing_result)
-                            
-                            # Send notifications for discovered transactions
-                            # if transaction_count > 0:
-                            #     try:
-                            #         import asyncio
-                            #         asyncio.run(self._notify_transactions_discovered(
-                            #             member_info=result.get("member_info", {}),
-                            #             transactions=result.get("transactions", []),
-                            #             filing_info=filing_info
-                            #         ))
-                            #     except Exception as e:
-                            #         print(f"Failed to send transaction notification: {e}")
-                            
-                            successful_count += 1
-                            processed_count += 1
-                    else:
-                        print(f"Failed to download PDF: {pdf_id}")
-                        # Download failure is usually temporary
-                        self.data_manager.mark_filing_error(pdf_url, "Failed to download PDF", is_permanent=False)
-                        
-                except Exception as e:
-                    error_msg = str(e)
-                    print(f"Error processing {pdf_id}: {error_msg}")
-                    
-                    # Determine if this is a permanent error
-                    is_permanent = self._is_permanent_error(error_msg)
-                    self.data_manager.mark_filing_error(pdf_url, error_msg, is_permanent)
-                    
-                    if is_permanent:
+
+        # PDF parsing holds the GIL, so extract in worker processes (0 = use threads)
+        extract_workers = min(int(os.getenv("EXTRACT_WORKERS", os.cpu_count() or 1)), len(files_to_process))
+        if extract_workers > 0:
+            self._extract_pool = ProcessPoolExecutor(max_workers=extract_workers, mp_context=pool_mp_context())
+
+        # Coalesce the error and journal writes into one save per file
+        with self.data_manager.begin_batch():
+            try:
+                outcomes = run_async(self._process_pending_pdfs_async(files_to_process))
+
+                # Record outcomes on the main thread so DataManager writes stay serialized
+                for filing_info, outcome in zip(files_to_process, outcomes):
+                    pdf_url = filing_info.pdf_url
+
+                    if outcome["status"] == "ok":
+                        # Already journaled; folded into the JSON files once in finally
+                        successful_count += 1
                         processed_count += 1
-                        failed_count += 1
-        
-        finally:
-            self.trading_data_extractor.cleanup_temp_dir()
-        
+                    else:
+                        is_permanent = outcome["status"] == "perm_fail"
+                        self.data_manager.mark_filing_error(pdf_url, outcome["error"], is_permanent, now=now)
+
+                        if is_permanent:
+                            processed_count += 1
+                            failed_count += 1
+
+            finally:
+                if self._extract_pool is not None:
+                    self._extract_pool.shutdown()
+                    self._extract_pool = None
+                self.data_manager.commit_processed_journal(now=now)
+                self.trading_data_extractor.cleanup_temp_dir()
+
         results = {
             "processed": processed_count,
             "successful": successful_count,
@@ -241,6 +354,142 @@ class DailyRun:
         print(f"PDF Processing Summary: {successful_count} successful, {failed_count} failed")
         return results
     
+    async def _process_pending_pdfs_async(self, files_to_process: List[PendingFiling]) -> List[Dict]:
+        """
+        Download and extract filings concurrently.
+
+        Downloads share one aiohttp session and are capped by a semaphore sized by
+        PDF_WORKERS; extraction is CPU-bound and runs in the extraction process pool
+        (or the default thread executor without one) so it doesn't block the event loop.
+
+        Args:
+            files_to_process: Pending filings to process
+
+        Returns:
+            List of outcome dictionaries, in the same order as files_to_process
+        """
+        concurrency = int(os.getenv("PDF_WORKERS", 8))
+        semaphore = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        connector = aiohttp.TCPConnector(limit=concurrency)
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            tasks = [
+                asyncio.create_task(self._process_one_async(filing_info, session, semaphore))
+                for filing_info in files_to_process
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        outcomes = []
+        for filing_info, result in zip(files_to_process, results):
+            if isinstance(result, BaseException):
+                error_msg = str(result)
+                print(f"Error processing {filing_info.pdf_id}: {error_msg}")
+                status = "perm_fail" if self._is_permanent_error(error_msg) else "fail"
+                result = {"pdf_id": filing_info.pdf_id, "status": status, "error": error_msg}
+            outcomes.append(result)
+
+        return outcomes
+
+    async def _process_one_async(self, filing_info: PendingFiling, session: aiohttp.ClientSession,
+                                 semaphore: asyncio.Semaphore) -> Dict:
+        """
+        Download a single pending filing, then extract it off the event loop.
+
+        Args:
+            filing_info: Pending filing
+            session: Shared aiohttp session for downloads
+            semaphore: Semaphore bounding concurrent downloads
+
+        Returns:
+            Outcome dictionary (see _build_outcome)
+        """
+        pdf_id = filing_info.pdf_id
+        print(f"Processing: {filing_info.member_name} - {pdf_id}")
+
+        # PDFs are kept in memory; they are small, and parsing them never touches the disk
+        async with semaphore:
+            pdf_bytes = await self.trading_data_extractor.fetch_pdf_async(filing_info.pdf_url, session)
+
+        if not pdf_bytes:
+            print(f"Failed to download PDF: {pdf_id}")
+            # Download failure is usually temporary
+            return {"pdf_id": pdf_id, "status": "fail", "error": "Failed to download PDF"}
+
+        loop = asyncio.get_running_loop()
+        try:
+            if self._extract_pool is not None:
+                result = await loop.run_in_executor(
+                    self._extract_pool, _extract_worker, pdf_bytes, filing_info.pdf_url
+                )
+            else:
+                result = await loop.run_in_executor(
+                    None, self.trading_data_extractor.extract_trading_data, pdf_bytes, filing_info.pdf_url
+                )
+            outcome = self._build_outcome(filing_info, result)
+
+        except Exception as e:
+            error_msg = str(e)
+            print(f"Error processing {pdf_id}: {error_msg}")
+
+            # Determine if this is a permanent error
+            status = "perm_fail" if self._is_permanent_error(error_msg) else "fail"
+            outcome = {"pdf_id": pdf_id, "status": status, "error": error_msg}
+
+        # Journal each result as soon as it's ready (on the loop thread, not the executor)
+        if outcome["status"] == "ok":
+            self.data_manager.journal_processed_result(filing_info.pdf_url, outcome["result"])
+
+        return outcome
+
+    def _build_outcome(self, filing_info: PendingFiling, result: Dict) -> Dict:
+        """
+        Turn an extraction result into an outcome for the pending filing.
+
+        Args:
+            filing_info: Pending filing
+            result: Result dictionary from extract_trading_data
+
+        Returns:
+            Outcome dictionary with "pdf_id", "status" ("ok", "fail" or "perm_fail"),
+            and either "result" (processing result) or "error" (error message)
+        """
+        pdf_url = filing_info.pdf_url
+        pdf_id = filing_info.pdf_id
+
+        if result.get("error"):
+            error_msg = result["error"]
+            print(f"Error extracting data from {pdf_id}: {error_msg}")
+
+            # Determine if this is a permanent error
+            status = "perm_fail" if self._is_permanent_error(error_msg) else "fail"
+            return {"pdf_id": pdf_id, "status": status, "error": error_msg}
+
+        transaction_count = len(result.get("transactions", []))
+        print(f"Found {transaction_count} transactions in {pdf_id}")
+
+        processing_result = {
+            "pdf_url": pdf_url,
+            "member_info": result.get("member_info", {}),
+            "stock_transaction_count": transaction_count,
+            "parsed_at": result.get("parsed_at", datetime.now().isoformat()),
+            "transactions": result.get("transactions", [])
+        }
+
+        # Send notifications for discovered transactions
+        # if transaction_count > 0:
+        #     try:
+        #         import asyncio
+        #         asyncio.run(self._notify_transactions_discovered(
+        #             member_info=result.get("member_info", {}),
+        #             transactions=result.get("transactions", []),
+        #             filing_info=filing_info
+        #         ))
+        #     except Exception as e:
+        #         print(f"Failed to send transaction notification: {e}")
+
+        return {"pdf_id": pdf_id, "status": "ok", "result": processing_result}
+
     # def _save_extracted_transactions(self, filing_id: str, transactions: List[Dict]):
     #     """
     #     Save extracted transactions to trading data.
@@ -288,14 +537,7 @@ class DailyRun:
         Returns:
             True if error is permanent, False if transient
         """
-        permanent_patterns = [
-            "corrupted", "invalid format", "unsupported", 
-            "malformed", "no transactions found", "file not found",
-            "access denied", "invalid pdf", "permission denied"
-        ]
-        
-        error_lower = error_message.lower()
-        return any(pattern in error_lower for pattern in permanent_patterns)
+        return bool(PERMANENT_ERROR_RE.search(error_message))
     
     def _notify(self, request: NotificationRequest) -> NotificationResponse:
         """
@@ -308,7 +550,7 @@ class DailyRun:
             response: NotificationResponse object with success status
         """
         # Run the async notification in a new event loop
-        return asyncio.run(self._send_notification_async(request))
+        return run_async(self._send_notification_async(request))
 
     async def _send_notification_async(self, request: NotificationRequest) -> NotificationResponse:
         """
@@ -340,6 +582,14 @@ def main():
     
     # Create and run DailyRun instance
     daily_run = DailyRun()
+
+    if "--watch" in sys.argv:
+        print("Watching for new filings (Ctrl+C to stop)")
+        try:
+            daily_run.serve()
+        except KeyboardInterrupt:
+            pass
+        return 0
     
     try:
         summary = daily_run.run()
@@ -6,15 +6,23 @@ ensuring consistent error handling, atomic writes, and data validation.
 """
 
 import os
-import json
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-import tempfile
-from typing import Dict, List, Set, Optional
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
+import ijson
+import orjson
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; the journal lock is then a no-op
+    fcntl = None
+
 load_dotenv()
 
 
@@ -26,6 +34,15 @@ class DataManager:
     and validation for congress_filings.json and trading_data.json.
     """
 
+    # Matches the previous json.dump(indent=2, ensure_ascii=False) output byte for byte
+    JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    # Files at least this large are stream-parsed when only a small part is needed
+    STREAM_THRESHOLD = 1024 * 1024
+
+    # Buffer size for temp-file writes in _atomic_write
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
     def __init__(self, data_dir: str|None = None):
         """
         Initialize DataManager with specified data directory.
@@ -40,14 +57,153 @@ class DataManager:
         self.data_dir = Path(data_dir)
         self.congress_file = self.data_dir / "congress_filings.json"
         self.trading_file = self.data_dir / "trading_data.json"
+        self.processed_journal = self.data_dir / "processed_journal.jsonl"
+
+        # Plain-string paths for the hot os.* calls, avoiding pathlib overhead
+        self.data_dir_str = str(self.data_dir)
+        self.congress_file_str = str(self.congress_file)
+        self.trading_file_str = str(self.trading_file)
+        self.processed_journal_str = str(self.processed_journal)
+        self.journal_lock_str = self.processed_journal_str + ".lock"
+
+        # In-process caches of parsed JSON, keyed on the file's stat signature
+        self._congress_cache: Optional[Dict] = None
+        self._congress_stat: Optional[Tuple[int, int]] = None
+        self._trading_cache: Optional[Dict] = None
+        self._trading_stat: Optional[Tuple[int, int]] = None
+
+        # pdf_url -> (member_key, filing index), built lazily from the cached congress data
+        self._pdf_url_index: Optional[Dict[str, Tuple[str, int]]] = None
+        self._pdf_index_source: Optional[Dict] = None
+        self._streamed_pdf_urls: Optional[Tuple[Tuple[int, int], FrozenSet[str]]] = None
+
+        # Write coalescing: inside begin_batch() saves only mark the data dirty
+        self._batch_depth = 0
+        self._congress_dirty = False
+        self._trading_dirty = False
+        self._journal_committed = False
         
         # Ensure data directory exists
-        self.data_dir.mkdir(exist_ok=True)
+        os.makedirs(self.data_dir_str, exist_ok=True)
+
+    def _stat_signature(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """
+        Get a cheap change signature for a file.
+
+        Args:
+            file_path: File to stat
+
+        Returns:
+            (mtime_ns, size) tuple, or None if the file doesn't exist
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_congress_signature(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the change signature of congress_filings.json, for cheap change polling.
+
+        Returns:
+            (mtime_ns, size) tuple, or None if the file doesn't exist
+        """
+        return self._stat_signature(self.congress_file_str)
+
+    def invalidate_caches(self) -> None:
+        """
+        Drop cached file contents.
+
+        Call this after the JSON files were modified outside this DataManager
+        in a way that might not change their mtime or size.
+        """
+        self._congress_cache = None
+        self._congress_stat = None
+        self._trading_cache = None
+        self._trading_stat = None
+        self._pdf_url_index = None
+        self._pdf_index_source = None
+        self._streamed_pdf_urls = None
+
+    def _should_stream(self, signature: Optional[Tuple[int, int]],
+                       cache: Optional[Dict], cached_signature: Optional[Tuple[int, int]],
+                       threshold: Optional[int] = None) -> bool:
+        """
+        Decide whether to stream-parse a file instead of loading it fully.
+
+        Args:
+            signature: Current stat signature of the file
+            cache: Cached parsed data for the file, if any
+            cached_signature: Signature the cache was loaded at
+            threshold: Minimum file size to stream (defaults to STREAM_THRESHOLD)
+
+        Returns:
+            True if the file is large and there is no usable in-memory copy
+        """
+        if signature is None or self._batch_depth:
+            return False
+        if cache is not None and signature == cached_signature:
+            return False
+        return signature[1] >= (self.STREAM_THRESHOLD if threshold is None else threshold)
+
+    def should_stream_congress(self, threshold: Optional[int] = None) -> bool:
+        """
+        Check whether congress_filings.json is better stream-parsed than loaded.
+
+        Args:
+            threshold: Minimum file size to stream (defaults to STREAM_THRESHOLD)
+
+        Returns:
+            True if the file is at least threshold bytes and isn't already in memory
+        """
+        signature = self._stat_signature(self.congress_file_str)
+        return self._should_stream(signature, self._congress_cache, self._congress_stat, threshold)
+
+    @contextmanager
+    def begin_batch(self) -> Iterator["DataManager"]:
+        """
+        Coalesce saves until the end of the block.
+
+        Inside the block, save_congress_data/save_trading_data only update the
+        in-memory data; each dirty file is written once when the outermost
+        block exits (also on error, so finished work isn't lost). Batches nest.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.commit_batch()
+
+    def commit_batch(self) -> None:
+        """
+        Write any data left dirty by a batch.
+        """
+        if self._congress_dirty:
+            self._congress_dirty = False
+            self._atomic_write(self.congress_file_str, self._congress_cache)
+        if self._trading_dirty:
+            self._trading_dirty = False
+            self._atomic_write(self.trading_file_str, self._trading_cache)
+
+        # The journal can go only once its results are durably on disk
+        if self._journal_committed:
+            self._journal_committed = False
+            with self.journal_lock():
+                try:
+                    os.remove(self.processed_journal_str)
+                except FileNotFoundError:
+                    pass
 
 
     def load_congress_data(self) -> Dict:
         """
         Load congressional filings data.
+
+        The parsed data is cached and reused until the file changes on disk,
+        so callers share (and may mutate) the same dictionary.
         
         Returns:
             Dictionary containing congress filings data with structure:
@@ -64,7 +220,11 @@ class DataManager:
                 }
             }
         """
-        if not self.congress_file.exists():
+        if self._congress_dirty:
+            return self._congress_cache
+
+        signature = self._stat_signature(self.congress_file_str)
+        if signature is None:
             return {
                 "last_updated": None,
                 "total_members": 0,
@@ -72,9 +232,12 @@ class DataManager:
                 "members": {}
             }
         
+        if self._congress_cache is not None and signature == self._congress_stat:
+            return self._congress_cache
+
         try:
-            with open(self.congress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.congress_file_str, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Validate basic structure
             if not isinstance(data, dict) or "members" not in data:
@@ -89,16 +252,19 @@ class DataManager:
                     len(member.get("filings", [])) 
                     for member in data.get("members", {}).values()
                 )
+
+            self._congress_cache = data
+            self._congress_stat = signature
             return data
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError("Invalid JSON format in congress data file")
             
         except Exception as e:
             raise RuntimeError("Failed to load congress data") from e
 
 
-    def _atomic_write(self, file_path: Path, data: Dict) -> None:
+    def _atomic_write(self, file_path: str, data: Dict) -> None:
         """
         Write JSON data atomically (write to temp file, then rename).
         
@@ -113,47 +279,79 @@ class DataManager:
         #     backup_path = file_path.with_suffix(f".backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
         #     shutil.copy2(file_path, backup_path)
         
-        # Create temp file in the same directory as the target
-        dir_path = file_path.parent
-        
         try:
-            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=dir_path, delete=False) as tmp_file:
-                json.dump(data, tmp_file, indent=2, ensure_ascii=False)
-                temp_path = Path(tmp_file.name)
+            # Top-level keys starting with "_" are in-memory helpers and aren't persisted
+            payload = {key: value for key, value in data.items() if not key.startswith("_")}
+
+            # Create temp file next to the target so the replace stays on one filesystem
+            temp_path = f"{file_path}.{os.getpid()}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+            with os.fdopen(fd, "wb", buffering=self.WRITE_BUFFER_SIZE) as tmp_file:
+                tmp_file.write(orjson.dumps(payload, option=self.JSON_OPTIONS))
+                # Make the contents durable before the rename makes them visible
+                tmp_file.flush()
+                os.fsync(fd)
+                # The rename keeps mtime and size, so this is the target's new signature
+                stat = os.fstat(fd)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                # Reads are served from our cache, so don't let the freshly written pages
+                # push more useful data out of the page cache
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
 
             # Perform atomic replace
             os.replace(temp_path, file_path)  # atomic if on same filesystem
 
+            # Keep the cache warm with the data we just wrote
+            if file_path == self.congress_file_str:
+                self._congress_cache = data
+                self._congress_stat = signature
+            elif file_path == self.trading_file_str:
+                self._trading_cache = data
+                self._trading_stat = signature
+
         except Exception as e:
             # Clean up temp file on error
-            if 'temp_path' in locals() and temp_path.exists():
-                temp_path.unlink()
+            if 'temp_path' in locals() and os.path.exists(temp_path):
+                os.remove(temp_path)
             raise e
             
-    def save_congress_data(self, data: Dict) -> None:
+    def save_congress_data(self, data: Dict, metadata_dirty: bool = True) -> None:
         """
         Save congressional filings data atomically with validation.
         
         Args:
             data: Congress filings data to save
+            metadata_dirty: Whether members or filings were added or removed. Pass
+                False for in-place filing updates (e.g. status changes) to skip
+                recounting total_members/total_filings.
         """
         # Validate data structure
         if not isinstance(data, dict) or "members" not in data:
             raise ValueError("Invalid congress data structure")
         
         # Update metadata
-        data["total_members"] = len(data.get("members", {}))
-        data["total_filings"] = sum(
-            len(member.get("filings", [])) 
-            for member in data.get("members", {}).values()
-        )
+        if metadata_dirty or "total_filings" not in data:
+            data["total_members"] = len(data.get("members", {}))
+            data["total_filings"] = sum(
+                len(member.get("filings", [])) 
+                for member in data.get("members", {}).values()
+            )
         data["last_updated"] = datetime.now().isoformat()
-        self._atomic_write(self.congress_file, data)
+
+        if self._batch_depth:
+            self._congress_cache = data
+            self._congress_dirty = True
+            return
+        self._atomic_write(self.congress_file_str, data)
 
 
     def load_trading_data(self) -> Dict:
         """
         Load trading data.
+
+        The parsed data is cached and reused until the file changes on disk,
+        so callers share (and may mutate) the same dictionary.
         
         Returns:
             Dictionary containing trading data with structure:
@@ -161,10 +359,18 @@ class DataManager:
                 "last_updated": str,
                 "pending_processing": [...],
                 "summary": {...},
-                "processed_filings": {...}
+                "processed_filings": {...},
+                "_pending_by_url": {pdf_url: pending item}  # in-memory only
             }
+
+            Code that changes the pending queue should use "_pending_by_url";
+            save_trading_data rebuilds "pending_processing" from it.
         """
-        if not self.trading_file.exists():
+        if self._trading_dirty:
+            return self._trading_cache
+
+        signature = self._stat_signature(self.trading_file_str)
+        if signature is None:
             return {
                 "last_updated": "",
                 "pending_processing": [],
@@ -173,12 +379,16 @@ class DataManager:
                     "processed_pdfs": 0,
                     "pending_pdfs": 0
                 },
-                "processed_filings": {}
+                "processed_filings": {},
+                "_pending_by_url": {}
             }
         
+        if self._trading_cache is not None and signature == self._trading_stat:
+            return self._trading_cache
+
         try:
-            with open(self.trading_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.trading_file_str, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Validate basic structure
             required_fields = ["pending_processing", "processed_filings", "summary"]
@@ -192,10 +402,15 @@ class DataManager:
             summary.setdefault("processed_pdfs", len(data.get("processed_filings", {})))
             summary.setdefault("pending_pdfs", len(data.get("pending_processing", [])))
             data["summary"] = summary
-            
+
+            # Index the pending queue by URL for O(1) membership and removal
+            self._pending_map(data)
+
+            self._trading_cache = data
+            self._trading_stat = signature
             return data
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError("Invalid JSON format in trading data file") from e
         except Exception as e:
             raise
@@ -207,13 +422,35 @@ class DataManager:
         Args:
             data: Trading data to save
         """        
+        # Rebuild the on-disk pending list from the in-memory index
+        if "_pending_by_url" in data:
+            data["pending_processing"] = list(data["_pending_by_url"].values())
+
         # Update summary
         summary = data.setdefault("summary", {})
         summary["processed_pdfs"] = len(data.get("processed_filings", {}))
         summary["pending_pdfs"] = len(data.get("pending_processing", []))
         data["last_updated"] = datetime.now().isoformat()
-        
-        self._atomic_write(self.trading_file, data)
+
+        if self._batch_depth:
+            self._trading_cache = data
+            self._trading_dirty = True
+            return
+        self._atomic_write(self.trading_file_str, data)
+
+    def get_permanent_failure_urls(self) -> Set[str]:
+        """
+        Get PDF URLs that previously failed with a permanent error.
+
+        Returns:
+            Set of PDF URLs recorded by mark_filing_error(is_permanent=True)
+        """
+        trading_data = self.load_trading_data()
+        return {
+            pdf_url
+            for pdf_url, entry in trading_data.get("processed_filings", {}).items()
+            if isinstance(entry.get("result"), dict) and entry["result"].get("permanent")
+        }
 
     def get_pending_filings(self) -> List[Dict]:
         """
@@ -222,57 +459,244 @@ class DataManager:
         Returns:
             List of pending filing dictionaries
         """
+        signature = self._stat_signature(self.trading_file_str)
+        if self._should_stream(signature, self._trading_cache, self._trading_stat):
+            # Skip building the (large) processed_filings dict
+            with open(self.trading_file_str, 'rb') as f:
+                return list(ijson.items(f, "pending_processing.item", use_float=True))
+
         trading_data = self.load_trading_data()
-        return trading_data.get("pending_processing", [])
+        return list(self._pending_map(trading_data).values())
+
+    def _pending_map(self, trading_data: Dict) -> Dict[str, Dict]:
+        """
+        Get the pending queue of trading_data keyed by pdf_url, creating it if needed.
+
+        Args:
+            trading_data: Loaded trading data
+
+        Returns:
+            Dictionary mapping pdf_url to pending filing, in queue order
+        """
+        pending = trading_data.get("_pending_by_url")
+        if pending is None:
+            pending = {item["pdf_url"]: item for item in trading_data.get("pending_processing", [])}
+            trading_data["_pending_by_url"] = pending
+        return pending
     
-    def get_existing_pdf_urls(self) -> Set[str]:
+    def get_existing_pdf_urls(self) -> AbstractSet[str]:
         """
         Get set of all existing PDF URLs from congress filings data.
+
+        Returns a keys view of the pdf_url index rather than a separate set, so
+        there is one hash table over the URLs instead of two. The keys are the
+        filings' own pdf_link strings (with their hashes cached by Python), so
+        membership tests cost no more than hashing to fixed-size digests would.
         
         Returns:
-            Set of PDF URLs that have been scraped
+            Set-like collection of PDF URLs that have been scraped
         """
+        signature = self._stat_signature(self.congress_file_str)
+        if self._should_stream(signature, self._congress_cache, self._congress_stat):
+            if self._streamed_pdf_urls is None or self._streamed_pdf_urls[0] != signature:
+                # Only pull pdf_link out of each member's filings
+                with open(self.congress_file_str, 'rb') as f:
+                    members = ijson.kvitems(f, "members", use_float=True)
+                    urls = frozenset(map(itemgetter("pdf_link"), chain.from_iterable(
+                        member_data.get("filings", ()) for _, member_data in members
+                    )))
+                self._streamed_pdf_urls = (signature, urls)
+            return self._streamed_pdf_urls[1]
+
         congress_data = self.load_congress_data()
-        existing_urls = set()
-        
-        for member_data in congress_data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                existing_urls.add(filing["pdf_link"])
-        
-        return existing_urls
+        return self._get_pdf_index(congress_data).keys()
+
+    def _get_pdf_index(self, congress_data: Dict) -> Dict[str, Tuple[str, int]]:
+        """
+        Get the pdf_url -> (member_key, filing index) index for congress_data.
+
+        The index is rebuilt only when a different congress data object is passed,
+        i.e. after the file was reloaded from disk.
+
+        Args:
+            congress_data: Loaded congress filings data
+
+        Returns:
+            Dictionary mapping each filing's pdf_link to its location
+        """
+        if self._pdf_url_index is None or self._pdf_index_source is not congress_data:
+            self._pdf_url_index = {
+                filing["pdf_link"]: (member_key, i)
+                for member_key, member_data in congress_data.get("members", {}).items()
+                for i, filing in enumerate(member_data.get("filings", []))
+            }
+            self._pdf_index_source = congress_data
+        return self._pdf_url_index
+
+    def _find_filing(self, congress_data: Dict, pdf_url: str) -> Optional[Dict]:
+        """
+        Find a filing in congress_data by its PDF URL.
+
+        Args:
+            congress_data: Loaded congress filings data
+            pdf_url: PDF URL to look up
+
+        Returns:
+            The filing dictionary (mutable, part of congress_data) or None if not found
+        """
+        location = self._get_pdf_index(congress_data).get(pdf_url)
+        if location is None:
+            return None
+
+        member_key, index = location
+        filings = congress_data["members"].get(member_key, {}).get("filings", [])
+        if index < len(filings) and filings[index]["pdf_link"] == pdf_url:
+            return filings[index]
+
+        # The data was modified in place since the index was built
+        self._pdf_url_index = None
+        location = self._get_pdf_index(congress_data).get(pdf_url)
+        if location is None:
+            return None
+        member_key, index = location
+        return congress_data["members"][member_key]["filings"][index]
     
-    def mark_filing_processed(self, pdf_url: str, result: Dict) -> None:
+    def mark_filing_processed(self, pdf_url: str, result: Dict, now: Optional[str] = None) -> None:
         """
         Mark a filing as successfully processed.
         
         Args:
             pdf_url: The PDF URL that was processed
             result: The processing result to store
+            now: ISO timestamp to record (defaults to the current time)
+        """
+        self.mark_filings_processed({pdf_url: result}, now=now)
+
+    def mark_filings_processed(self, results: Dict[str, Dict], now: Optional[str] = None) -> None:
         """
+        Mark several filings as successfully processed with one load and save.
+
+        Args:
+            results: Mapping of processed PDF URL to its processing result
+            now: ISO timestamp to record (defaults to the current time)
+        """
+        if not results:
+            return
+
+        if now is None:
+            now = datetime.now().isoformat()
+
         # Load current data
         trading_data = self.load_trading_data()
         congress_data = self.load_congress_data()
-        
+
+        congress_updated = False
+        for pdf_url, result in results.items():
+            if self._apply_processed_result(congress_data, trading_data, pdf_url, result, now):
+                congress_updated = True
+
+        # Save updated data
+        if congress_updated:
+            self.save_congress_data(congress_data, metadata_dirty=False)
+        self.save_trading_data(trading_data)
+
+    def journal_processed_result(self, pdf_url: str, result: Dict) -> None:
+        """
+        Append a processing result to the processed-filings journal.
+
+        This is a constant-time append regardless of how large trading_data.json
+        has grown; commit_processed_journal folds the journal into the JSON files.
+
+        Args:
+            pdf_url: The PDF URL that was processed
+            result: The processing result to store
+        """
+        record = orjson.dumps({"pdf_url": pdf_url, "result": result})
+        with self.journal_lock(), open(self.processed_journal_str, 'ab') as f:
+            f.write(record + b"\n")
+
+    @contextmanager
+    def journal_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the processed-filings journal.
+
+        Appends and removals take this lock, so another process (delete_filing.py)
+        can rewrite the journal under it without losing lines appended meanwhile.
+        The lock is on a separate file because rewriting replaces the journal's inode.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        fd = os.open(self.journal_lock_str, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # Releases the lock
+
+    def commit_processed_journal(self, now: Optional[str] = None) -> int:
+        """
+        Apply all journaled processing results and clear the journal.
+
+        Also used at startup to recover results journaled by an interrupted run;
+        re-applying a result is idempotent.
+
+        Args:
+            now: ISO timestamp to record (defaults to the current time)
+
+        Returns:
+            Number of results applied
+        """
+        results = {}
+        try:
+            with open(self.processed_journal_str, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A torn final line from a crash mid-append
+                        continue
+                    results[record["pdf_url"]] = record["result"]
+        except FileNotFoundError:
+            return 0
+
+        self.mark_filings_processed(results, now=now)
+        if self._batch_depth:
+            self._journal_committed = True
+        else:
+            with self.journal_lock():
+                os.remove(self.processed_journal_str)
+        return len(results)
+
+    def _apply_processed_result(self, congress_data: Dict, trading_data: Dict,
+                                pdf_url: str, result: Dict, now: str) -> bool:
+        """
+        Apply one processing result to already-loaded data, without saving.
+
+        Args:
+            congress_data: Loaded congress filings data
+            trading_data: Loaded trading data
+            pdf_url: The PDF URL that was processed
+            result: The processing result to store
+            now: ISO timestamp to record
+
+        Returns:
+            True if congress_data was modified
+        """
         # Update processing status in congress_filings.json (minimal data only)
         congress_updated = False
-        for member_key, member_data in congress_data["members"].items():
-            for filing in member_data["filings"]:
-                if filing["pdf_link"] == pdf_url:
-                    filing["processing_status"] = "processed"
-                    filing["processed_at"] = datetime.now().isoformat()
-                    # Only store minimal success indicator, not full transaction data
-                    if result and not result.get("error"):
-                        filing["has_stock_transactions"] = result.get("transaction_count", 0) > 0
-                    congress_updated = True
-                    break
-            if congress_updated:
-                break
+        filing = self._find_filing(congress_data, pdf_url)
+        if filing is not None:
+            filing["processing_status"] = "processed"
+            filing["processed_at"] = now
+            # Only store minimal success indicator, not full transaction data
+            if result and not result.get("error"):
+                filing["has_stock_transactions"] = result.get("transaction_count", 0) > 0
+            congress_updated = True
         
         # Remove from pending queue
-        trading_data["pending_processing"] = [
-            item for item in trading_data["pending_processing"] 
-            if item["pdf_url"] != pdf_url
-        ]
+        self._pending_map(trading_data).pop(pdf_url, None)
         
         # Add full processing result to trading_data.json only
         if result:
@@ -282,14 +706,11 @@ class DataManager:
             #     "processed_at": datetime.now().isoformat(),
             #     "result": result
             # }
-        
-        # Save updated data
-        if congress_updated:
-            self.save_congress_data(congress_data)
-        self.save_trading_data(trading_data)
-        
+
+        return congress_updated
     
-    def mark_filing_error(self, pdf_url: str, error_message: str, is_permanent: bool = False) -> None:
+    def mark_filing_error(self, pdf_url: str, error_message: str, is_permanent: bool = False,
+                          now: Optional[str] = None) -> None:
         """
         Mark a filing as having an error.
         
@@ -297,37 +718,30 @@ class DataManager:
             pdf_url: The PDF URL that had an error
             error_message: Description of the error
             is_permanent: Whether this is a permanent error that shouldn't be retried
+            now: ISO timestamp to record (defaults to the current time)
         """
         trading_data = self.load_trading_data()
         
         if is_permanent:
+            if now is None:
+                now = datetime.now().isoformat()
+
             # Remove from pending and mark as processed with error
-            trading_data["pending_processing"] = [
-                item for item in trading_data["pending_processing"] 
-                if item["pdf_url"] != pdf_url
-            ]
+            self._pending_map(trading_data).pop(pdf_url, None)
             
             trading_data["processed_filings"][pdf_url] = {
-                "processed_at": datetime.now().isoformat(),
+                "processed_at": now,
                 "result": {"error": error_message, "permanent": True}
             }
             
             # Update congress_filings.json for permanent errors
             congress_data = self.load_congress_data()
-            congress_updated = False
-            for member_key, member_data in congress_data["members"].items():
-                for filing in member_data["filings"]:
-                    if filing["pdf_link"] == pdf_url:
-                        filing["processing_status"] = "failed"
-                        filing["failed_at"] = datetime.now().isoformat()
-                        filing["error"] = error_message
-                        congress_updated = True
-                        break
-                if congress_updated:
-                    break
-            
-            if congress_updated:
-                self.save_congress_data(congress_data)
+            filing = self._find_filing(congress_data, pdf_url)
+            if filing is not None:
+                filing["processing_status"] = "failed"
+                filing["failed_at"] = now
+                filing["error"] = error_message
+                self.save_congress_data(congress_data, metadata_dirty=False)
             
         else:
             # Keep in pending queue for retry, just log the error
@@ -336,12 +750,13 @@ class DataManager:
         # Save trading data
         self.save_trading_data(trading_data)
     
-    def add_pending_filing(self, filing_info: Dict) -> bool:
+    def add_pending_filing(self, filing_info: Dict, now: Optional[str] = None) -> bool:
         """
         Add a filing to the pending processing queue.
         
         Args:
             filing_info: Filing information dictionary
+            now: ISO timestamp to record (defaults to the current time)
             
         Returns:
             True if added, False if already exists
@@ -349,17 +764,45 @@ class DataManager:
         trading_data = self.load_trading_data()
         
         # Check if already in pending queue
-        existing_urls = {item["pdf_url"] for item in trading_data["pending_processing"]}
-        if filing_info["pdf_url"] in existing_urls:
+        pending = self._pending_map(trading_data)
+        if filing_info["pdf_url"] in pending:
             return False
         
         # Add discovered timestamp
-        filing_info["discovered_at"] = datetime.now().isoformat()
-        trading_data["pending_processing"].append(filing_info)
+        filing_info["discovered_at"] = now or datetime.now().isoformat()
+        pending[filing_info["pdf_url"]] = filing_info
         
         self.save_trading_data(trading_data)
         return True
     
+    def add_pending_filings_bulk(self, filings: List[Dict], now: Optional[str] = None) -> int:
+        """
+        Add several filings to the pending processing queue with one load and save.
+
+        Args:
+            filings: List of filing information dictionaries
+            now: ISO timestamp to record as discovered_at (defaults to the current time)
+
+        Returns:
+            Number of filings added (filings already queued are skipped)
+        """
+        trading_data = self.load_trading_data()
+
+        pending = self._pending_map(trading_data)
+        discovered_at = now or datetime.now().isoformat()
+
+        added_count = 0
+        for filing_info in filings:
+            if filing_info["pdf_url"] in pending:
+                continue
+            pending[filing_info["pdf_url"]] = dict(filing_info, discovered_at=discovered_at)
+            added_count += 1
+
+        if added_count:
+            self.save_trading_data(trading_data)
+
+        return added_count
+    
     def get_last_update_time(self) -> Optional[datetime]:
         """
         Get the last update time from congress data.
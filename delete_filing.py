@@ -8,18 +8,26 @@ with real system runs.
 
 Usage:
     python delete_filing.py --pdf-id 20026537
+    python delete_filing.py --pdf-id 20026537 --pdf-id 20026727
+    python delete_filing.py --pdf-ids-file ids.txt
     python delete_filing.py --list-processed
+    python delete_filing.py --list-processed --limit 10
     python delete_filing.py --member "Allen, Hon.. Richard W." --list
 """
 
-import json
 import argparse
+import gzip
+import heapq
 import sys
 import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, Iterable, List, Optional
 
+import ijson
+import msgspec
+import orjson
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -29,6 +37,37 @@ sys.path.insert(0, str(Path(__file__).parent))
 from data_manager import DataManager
 
 
+# Typed views of the data files for list_processed_filings. Decoding into these
+# structs skips every field they don't declare, and msgspec.Raw leaves the large
+# processed_filings entries (transaction lists) unparsed.
+class _ListedFiling(msgspec.Struct):
+    pdf_id: str
+    year: str
+    filing_type: str
+    pdf_link: str
+    processing_status: Optional[str] = None
+    has_transactions: bool = False
+    processed_at: Optional[str] = 'Unknown'
+
+
+class _ListedMember(msgspec.Struct):
+    name: str
+    filings: List[_ListedFiling] = []
+
+
+class _ListedCongressData(msgspec.Struct):
+    members: Dict[str, _ListedMember] = {}
+
+
+class _ListedTradingData(msgspec.Struct):
+    processed_filings: Dict[str, msgspec.Raw] = {}
+    filings: Dict[str, msgspec.Raw] = {}
+
+
+_LISTED_CONGRESS_DECODER = msgspec.json.Decoder(_ListedCongressData)
+_LISTED_TRADING_DECODER = msgspec.json.Decoder(_ListedTradingData)
+
+
 def safe_print(*args, **kwargs):
     """Print with broken pipe protection."""
     try:
@@ -53,111 +92,312 @@ class FilingDeleter:
         self.data_manager = DataManager(data_dir)
         self.congress_filings_path = self.data_dir / "congress_filings.json"
         self.trading_data_path = self.data_dir / "trading_data.json"
+        # pdf_id -> (member_key, filing) for the most recently loaded congress data
+        self._pdf_index: Optional[Dict[str, tuple[str, Dict]]] = None
+        # pdf_id -> number of pending_processing entries, for the same loaded data
+        self._pending_counts: Optional[Counter] = None
+        # Parsed (congress_data, trading_data), shared by every caller until the next save
+        self._cached_data: Optional[tuple[Dict, Dict]] = None
     
     def load_data(self) -> tuple[Dict, Dict]:
-        """Load both congress filings and trading data."""
-        with open(self.congress_filings_path, 'r') as f:
-            congress_data = json.load(f)
-        
-        with open(self.trading_data_path, 'r') as f:
-            trading_data = json.load(f)
-        
-        return congress_data, trading_data
+        """
+        Load both congress filings and trading data, and index filings by PDF ID.
+
+        The files are parsed once per FilingDeleter; later calls return the same
+        (possibly modified) dictionaries.
+        """
+        if self._cached_data is not None:
+            return self._cached_data
+        
+        congress_data = orjson.loads(self.congress_filings_path.read_bytes())
+        trading_data = orjson.loads(self.trading_data_path.read_bytes())
+        
+        self._pdf_index = {
+            filing['pdf_id']: (member_key, filing)
+            for member_key, member_data in congress_data['members'].items()
+            for filing in member_data['filings']
+        }
+        # pending_processing stays a list on disk; count it once here instead of scanning per lookup
+        self._pending_counts = Counter(f['pdf_id'] for f in trading_data.get('pending_processing', []))
+        
+        self._cached_data = (congress_data, trading_data)
+        return self._cached_data
     
-    def save_data(self, congress_data: Dict, trading_data: Dict) -> None:
-        """Save both datasets with timestamp updates."""
+    # Number of compressed backups kept per data file
+    BACKUPS_TO_KEEP = 5
+
+    def _write_backup(self, path: Path, buf: bytes, timestamp: str) -> Path:
+        """Write a gzip-compressed backup of a data file and prune the oldest ones."""
+        backup_path = path.with_suffix(f'.backup.{timestamp}.json.gz')
+        # Level 1 still shrinks JSON several-fold at a fraction of the CPU of the default
+        with gzip.open(backup_path, 'wb', compresslevel=1) as f:
+            f.write(buf)
+        
+        # Timestamps sort lexicographically, so the oldest come first
+        backups = sorted(path.parent.glob(f'{path.stem}.backup.*.json.gz'))
+        for old_backup in backups[:-self.BACKUPS_TO_KEEP]:
+            old_backup.unlink()
+        
+        return backup_path
+
+    def _write_atomic(self, path: Path, buf: bytes) -> None:
+        """Write bytes to a temp file next to path, then atomically replace path."""
+        # Same <name>.json.<pid>.tmp naming as DataManager, covered by .gitignore
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def save_data(self, congress_data: Dict, trading_data: Dict, backup: bool = False) -> None:
+        """
+        Save both datasets with timestamp updates.
+
+        Each dataset is serialized once; the same bytes go to the backup (if
+        requested) and, via a temp file and os.replace, to the data file.
+        """
         # Update timestamps
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
         congress_data['last_updated'] = timestamp
         trading_data['last_updated'] = timestamp
         
-        # Create backups
-        # backup_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        # congress_backup = self.congress_filings_path.with_suffix(f'.backup.{backup_timestamp}.json')
-        # trading_backup = self.trading_data_path.with_suffix(f'.backup.{backup_timestamp}.json')
-        
-        # Save backups
-        # with open(congress_backup, 'w') as f:
-        #     json.dump(congress_data, f, indent=2)
+        # Same layout DataManager writes, so the files diff cleanly
+        congress_buf = orjson.dumps(congress_data, option=DataManager.JSON_OPTIONS)
+        trading_buf = orjson.dumps(trading_data, option=DataManager.JSON_OPTIONS)
         
-        # with open(trading_backup, 'w') as f:
-        #     json.dump(trading_data, f, indent=2)
+        # Create backups
+        if backup:
+            backup_timestamp = now.strftime("%Y%m%d_%H%M%S")
+            congress_backup = self._write_backup(self.congress_filings_path, congress_buf, backup_timestamp)
+            trading_backup = self._write_backup(self.trading_data_path, trading_buf, backup_timestamp)
         
         # Save updated files
-        with open(self.congress_filings_path, 'w') as f:
-            json.dump(congress_data, f, indent=2)
+        self._write_atomic(self.congress_filings_path, congress_buf)
+        self._write_atomic(self.trading_data_path, trading_buf)
+        self._cached_data = (congress_data, trading_data)
+        
+        if backup:
+            print(f"✅ Data saved with backups:")
+            print(f"   - {congress_backup}")
+            print(f"   - {trading_backup}")
+    
+    def _drop_journal_entries(self, pdf_urls: AbstractSet[str]) -> int:
+        """
+        Remove journaled processing results for the given PDF URLs.
         
-        with open(self.trading_data_path, 'w') as f:
-            json.dump(trading_data, f, indent=2)
+        The journal is JSONL, so it is filtered line by line into a temp file;
+        kept lines are copied as-is without being re-serialized. Without this, a
+        journal left by an interrupted run would re-add a deleted filing's
+        results the next time it is replayed. The journal lock is held
+        throughout, so a running daily run can't append a line that the
+        replace would then lose.
         
-        # print(f"✅ Data saved with backups:")
-        # print(f"   - {congress_backup}")
-        # print(f"   - {trading_backup}")
-    
+        Args:
+            pdf_urls: PDF URLs of the deleted filings
+            
+        Returns:
+            Number of journal entries removed
+        """
+        journal_path = self.data_manager.processed_journal
+        tmp_path = journal_path.with_name(f'{journal_path.name}.{os.getpid()}.tmp')
+        dropped = 0
+        with self.data_manager.journal_lock():
+            try:
+                inp = open(journal_path, 'rb')
+            except FileNotFoundError:
+                return 0
+            
+            try:
+                with inp, open(tmp_path, 'wb') as out:
+                    for line in inp:
+                        try:
+                            pdf_url = orjson.loads(line)["pdf_url"]
+                        except (orjson.JSONDecodeError, KeyError, TypeError):
+                            # Torn lines are skipped on replay anyway; leave them be
+                            pdf_url = None
+                        if pdf_url in pdf_urls:
+                            dropped += 1
+                        else:
+                            out.write(line)
+                    
+                    if dropped:
+                        out.flush()
+                        os.fsync(out.fileno())
+                
+                if dropped:
+                    os.replace(tmp_path, journal_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        return dropped
+
+    def _find_member_filing(self, pdf_id: str) -> Optional[tuple[str, Dict, Dict]]:
+        """Find a filing via the index once loaded; otherwise stream congress filings member by member."""
+        if self._cached_data is not None:
+            entry = self._pdf_index.get(pdf_id)
+            if entry is None:
+                return None
+            member_key, filing = entry
+            return member_key, self._cached_data[0]['members'][member_key], filing
+        
+        with open(self.congress_filings_path, 'rb') as f:
+            for member_key, member_data in ijson.kvitems(f, 'members', use_float=True):
+                for filing in member_data['filings']:
+                    if filing['pdf_id'] == pdf_id:
+                        return member_key, member_data, filing
+        
+        return None
+
+    def _find_trading_entries(self, pdf_id: str) -> tuple[int, Optional[Dict]]:
+        """
+        Find the trading data entries belonging to a PDF ID.
+
+        Uses the loaded data if available; otherwise streams the file once,
+        collecting both results in the same pass.
+
+        Returns:
+            Number of pending entries and the processed_filings entry (or None)
+        """
+        if self._cached_data is not None:
+            trading_data = self._cached_data[1]
+            return self._pending_counts[pdf_id], trading_data.get('processed_filings', {}).get(pdf_id)
+        
+        pending_prefix = 'pending_processing.item.pdf_id'
+        filed_prefix = f'processed_filings.{pdf_id}'
+        pending_count = 0
+        pending_done = False
+        filed_data = None
+        builder = None
+        with open(self.trading_data_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    # Only the matching entry is materialized; everything else is just tokenized
+                    if prefix == filed_prefix and event in ('end_map', 'end_array'):
+                        filed_data = builder.value
+                        builder = None
+                        if pending_done:
+                            break
+                    else:
+                        builder.event(event, value)
+                elif prefix == pending_prefix:
+                    pending_count += value == pdf_id
+                elif prefix == 'pending_processing' and event == 'end_array':
+                    pending_done = True
+                    if filed_data is not None:
+                        break
+                elif prefix == filed_prefix:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    if event not in ('start_map', 'start_array'):
+                        filed_data = builder.value
+                        builder = None
+
+        return pending_count, filed_data
+
     def find_filing_by_pdf_id(self, pdf_id: str) -> Optional[tuple[str, Dict]]:
         """Find a filing by its PDF ID and return member_key and filing data."""
-        congress_data, _ = self.load_data()
+        # O(1) once the data has been loaded; otherwise stream the file
+        if self._pdf_index is not None:
+            return self._pdf_index.get(pdf_id)
         
-        for member_key, member_data in congress_data['members'].items():
-            for filing in member_data['filings']:
-                if filing['pdf_id'] == pdf_id:
-                    return member_key, filing
+        result = self._find_member_filing(pdf_id)
+        if result is None:
+            return None
         
-        return None
+        member_key, _, filing = result
+        return member_key, filing
     
-    def list_processed_filings(self, member_name: Optional[str] = None) -> List[Dict]:
-        """List all processed filings, optionally filtered by member."""
-        congress_data, trading_data = self.load_data()
+    def list_processed_filings(self, member_name: Optional[str] = None,
+                               limit: Optional[int] = None) -> List[Dict]:
+        """List processed filings, newest first, optionally filtered by member and limited."""
+        # Read-only, so decode just the fields the listing needs
+        congress_data = _LISTED_CONGRESS_DECODER.decode(self.congress_filings_path.read_bytes())
+        trading_data = _LISTED_TRADING_DECODER.decode(self.trading_data_path.read_bytes())
+        processed_by_url = trading_data.processed_filings
+        filed_by_id = trading_data.filings
         processed_filings = []
         
-        for member_key, member_data in congress_data['members'].items():
+        for member_key, member_data in congress_data.members.items():
             # Filter by member if specified
-            if member_name and member_name.lower() not in member_data['name'].lower():
+            if member_name and member_name.lower() not in member_data.name.lower():
                 continue
                 
-            for filing in member_data['filings']:
-                if filing.get('processing_status') == 'processed':
+            for filing in member_data.filings:
+                if filing.processing_status == 'processed':
                     # Check if it has transactions
-                    pdf_url = filing['pdf_link']
-                    has_processed_transactions = pdf_url in trading_data.get('processed_filings', {})
-                    has_filed_transactions = filing['pdf_id'] in trading_data.get('filings', {})
+                    pdf_url = filing.pdf_link
+                    has_processed_transactions = pdf_url in processed_by_url
+                    has_filed_transactions = filing.pdf_id in filed_by_id
                     
                     processed_filings.append({
-                        'pdf_id': filing['pdf_id'],
-                        'member_name': member_data['name'],
+                        'pdf_id': filing.pdf_id,
+                        'member_name': member_data.name,
                         'member_key': member_key,
-                        'year': filing['year'],
-                        'filing_type': filing['filing_type'],
-                        'has_transactions': filing.get('has_transactions', False),
+                        'year': filing.year,
+                        'filing_type': filing.filing_type,
+                        'has_transactions': filing.has_transactions,
                         'has_processed_transactions': has_processed_transactions,
                         'has_filed_transactions': has_filed_transactions,
-                        'processed_at': filing.get('processed_at', 'Unknown'),
+                        'processed_at': filing.processed_at,
                         'pdf_url': pdf_url
                     })
         
+        # Top-N selection avoids sorting everything when only a few are shown
+        if limit is not None:
+            return heapq.nlargest(limit, processed_filings, key=lambda x: x['processed_at'])
         return sorted(processed_filings, key=lambda x: x['processed_at'], reverse=True)
     
-    def delete_filing(self, pdf_id: str, dry_run: bool = False) -> bool:
+    @staticmethod
+    def _adjust_total_filings(congress_data: Dict, removed: int) -> int:
+        """
+        Decrement total_filings by the number of removed filings.
+        
+        Args:
+            congress_data: Congress filings data (already updated)
+            removed: Number of filing records removed
+            
+        Returns:
+            The new total filings count
+        """
+        total_filings = congress_data.get('total_filings')
+        if total_filings is None:
+            # Counted once (after removal) if the file predates the counter
+            total_filings = sum(len(member['filings']) for member in congress_data['members'].values())
+        else:
+            total_filings -= removed
+        congress_data['total_filings'] = total_filings
+        return total_filings
+
+    def delete_filing(self, pdf_id: str, dry_run: bool = False, backup: bool = False,
+                      assume_yes: bool = False) -> bool:
         """
         Delete a filing and its associated transactions.
         
         Args:
             pdf_id: The PDF ID to delete
             dry_run: If True, only show what would be deleted
+            backup: If True, write timestamped backups of both data files
+            assume_yes: If True, skip the confirmation prompt
             
         Returns:
             True if filing was found and deleted (or would be deleted)
         """
-        congress_data, trading_data = self.load_data()
+        # A dry run only streams the files; a real delete loads them anyway, so
+        # load them up front and look everything up in the index
+        if not dry_run:
+            self.load_data()
         
-        # Find the filing
-        result = self.find_filing_by_pdf_id(pdf_id)
+        result = self._find_member_filing(pdf_id)
         if not result:
             print(f"❌ Filing with PDF ID '{pdf_id}' not found")
             return False
         
-        member_key, filing = result
-        member_data = congress_data['members'][member_key]
+        member_key, member_data, filing = result
         # pdf_url = filing['pdf_link']
         
         print(f"📄 Found filing:")
@@ -170,26 +410,20 @@ class FilingDeleter:
         
         # Check what data would be deleted
         filing_in_congress = True
-        pending_filing_exists = any(f["pdf_id"] == pdf_id for f in trading_data.get("pending_processing", []))
-        filed_transactions_exist = pdf_id in trading_data.get('processed_filings', {})
+        pending_count, filed_data = self._find_trading_entries(pdf_id)
+        pending_filing_exists = pending_count > 0
+        processed_entry_exists = filed_data is not None
         
         print(f"\n🗑️  Data to be deleted:")
         print(f"   - Congress filing record: {'✓' if filing_in_congress else '✗'}")
         print(f"   - Pending filing: {'✓' if pending_filing_exists else '✗'}")
-        print(f"   - Filed transactions: {'✓' if filed_transactions_exist else '✗'}")
+        print(f"   - Filed transactions: {'✓' if processed_entry_exists else '✗'}")
         
-        # Remove pending filing if it exists
         if pending_filing_exists:
-            before_count = len(trading_data["pending_processing"])
-            trading_data["pending_processing"] = [
-                f for f in trading_data["pending_processing"] if f["pdf_id"] != pdf_id
-            ]
-            after_count = len(trading_data["pending_processing"])
-            print(f"     └─ {before_count - after_count} pending filing(s)")
+            print(f"     └─ {pending_count} pending filing(s)")
             
         
-        if filed_transactions_exist:
-            filed_data = trading_data['processed_filings'][pdf_id]
+        if processed_entry_exists:
             transaction_count = len(filed_data.get('transactions', []))
             print(f"     └─ {transaction_count} filed transactions")
         
@@ -198,42 +432,54 @@ class FilingDeleter:
             return True
         
         # Confirm deletion
-        print(f"\n⚠️  This will permanently delete the filing and all associated transaction data!")
-        confirm = input("Are you sure you want to proceed? (yes/no): ").lower().strip()
-        
-        if confirm not in ['yes', 'y']:
-            print("❌ Deletion cancelled")
-            return False
+        if not assume_yes:
+            print(f"\n⚠️  This will permanently delete the filing and all associated transaction data!")
+            confirm = input("Are you sure you want to proceed? (yes/no): ").lower().strip()
+            
+            if confirm not in ['yes', 'y']:
+                print("❌ Deletion cancelled")
+                return False
         
         # Perform deletion
+        congress_data, trading_data = self.load_data()
+        member_key, _ = self._pdf_index[pdf_id]
+        member_data = congress_data['members'][member_key]
         changes_made = False
+        removed = 0
         
         # 1. Remove from congress filings
         if filing_in_congress:
+            before = len(member_data['filings'])
             member_data['filings'] = [f for f in member_data['filings'] if f['pdf_id'] != pdf_id]
+            removed = before - len(member_data['filings'])
+            del self._pdf_index[pdf_id]
             print(f"✅ Removed filing from congress filings")
             changes_made = True
         
-        # 2. Remove from processed filings
+        # 2. Remove from the pending queue
         if pending_filing_exists:
-            del trading_data['processed_filings'][pdf_id]
-            print(f"✅ Removed processed filing data")
+            trading_data["pending_processing"] = [
+                f for f in trading_data["pending_processing"] if f["pdf_id"] != pdf_id
+            ]
+            del self._pending_counts[pdf_id]
+            print(f"✅ Removed pending filing")
             changes_made = True
         
-        # 3. Remove from filed transactions
-        if filed_transactions_exist:
+        # 3. Remove processed filing data and its transactions
+        if processed_entry_exists:
             del trading_data['processed_filings'][pdf_id]
-            print(f"✅ Removed filed transactions")
+            print(f"✅ Removed processed filing data and transactions")
             changes_made = True
         
         # 4. Update counts
         if changes_made:
             # Update congress filings count
-            total_filings = sum(len(member['filings']) for member in congress_data['members'].values())
-            congress_data['total_filings'] = total_filings
+            total_filings = self._adjust_total_filings(congress_data, removed)
             
             # Save the updated data
-            self.save_data(congress_data, trading_data)
+            self.save_data(congress_data, trading_data, backup=backup)
+            if self._drop_journal_entries({filing['pdf_link']}):
+                print(f"✅ Removed journaled processing result")
             print(f"\n🎉 Filing '{pdf_id}' successfully deleted!")
             print(f"   - Updated total filings count: {total_filings}")
             
@@ -242,6 +488,95 @@ class FilingDeleter:
             print(f"⚠️  No changes made - filing data not found")
             return False
 
+    def delete_filings(self, pdf_ids: Iterable[str], dry_run: bool = False, backup: bool = False,
+                       assume_yes: bool = False) -> int:
+        """
+        Delete several filings and their associated transactions with one load and save.
+        
+        Args:
+            pdf_ids: The PDF IDs to delete
+            dry_run: If True, only show what would be deleted
+            backup: If True, write timestamped backups of both data files
+            assume_yes: If True, skip the confirmation prompt
+            
+        Returns:
+            Number of filings found (and deleted or that would be deleted)
+        """
+        ids = set(pdf_ids)
+        congress_data, trading_data = self.load_data()
+        
+        found = ids & self._pdf_index.keys()
+        for pdf_id in sorted(ids - found):
+            print(f"❌ Filing with PDF ID '{pdf_id}' not found")
+        
+        if not found:
+            return 0
+        
+        # Check what data would be deleted
+        pending = trading_data.get("pending_processing", [])
+        pending_count = sum(self._pending_counts[pdf_id] for pdf_id in found)
+        processed = trading_data.get('processed_filings', {})
+        filed_ids = found & processed.keys()
+        transaction_count = sum(len(processed[pdf_id].get('transactions', [])) for pdf_id in filed_ids)
+        
+        print(f"🗑️  Data to be deleted for {len(found)} filing(s):")
+        print(f"   - Congress filing records: {len(found)}")
+        print(f"   - Pending filings: {pending_count}")
+        print(f"   - Filed transactions: {len(filed_ids)} filing(s), {transaction_count} transactions")
+        
+        if dry_run:
+            print(f"\n🔍 DRY RUN: No changes made")
+            return len(found)
+        
+        # Confirm deletion
+        if not assume_yes:
+            print(f"\n⚠️  This will permanently delete the filings and all associated transaction data!")
+            confirm = input("Are you sure you want to proceed? (yes/no): ").lower().strip()
+            
+            if confirm not in ['yes', 'y']:
+                print("❌ Deletion cancelled")
+                return 0
+        
+        # Filter only the members that own one of the filings, once each
+        removed = 0
+        for member_key in {self._pdf_index[pdf_id][0] for pdf_id in found}:
+            member_data = congress_data['members'][member_key]
+            before = len(member_data['filings'])
+            member_data['filings'] = [f for f in member_data['filings'] if f['pdf_id'] not in found]
+            removed += before - len(member_data['filings'])
+        pdf_urls = {self._pdf_index[pdf_id][1]['pdf_link'] for pdf_id in found}
+        for pdf_id in found:
+            del self._pdf_index[pdf_id]
+        
+        if pending_count:
+            trading_data["pending_processing"] = [f for f in pending if f["pdf_id"] not in found]
+            for pdf_id in found:
+                del self._pending_counts[pdf_id]
+        
+        for pdf_id in filed_ids:
+            del processed[pdf_id]
+        
+        # Update congress filings count
+        total_filings = self._adjust_total_filings(congress_data, removed)
+        
+        self.save_data(congress_data, trading_data, backup=backup)
+        journal_dropped = self._drop_journal_entries(pdf_urls)
+        if journal_dropped:
+            print(f"✅ Removed {journal_dropped} journaled processing result(s)")
+        print(f"\n🎉 {len(found)} filing(s) successfully deleted!")
+        print(f"   - Updated total filings count: {total_filings}")
+        
+        return len(found)
+
+
+def read_pdf_ids_file(path: str) -> List[str]:
+    """Read PDF IDs from a file, one per line (blank lines and # comments are ignored)."""
+    with open(path, 'r') as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith('#')
+        ]
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -249,7 +584,12 @@ def main():
     )
     parser.add_argument(
         '--pdf-id',
-        help="PDF ID of the filing to delete (e.g., 20026537)"
+        action='append',
+        help="PDF ID of the filing to delete (e.g., 20026537); repeat to delete several"
+    )
+    parser.add_argument(
+        '--pdf-ids-file',
+        help="File with PDF IDs to delete, one per line"
     )
     parser.add_argument(
         '--list-processed',
@@ -260,11 +600,26 @@ def main():
         '--member',
         help="Filter listings by member name (partial match)"
     )
+    parser.add_argument(
+        '--limit',
+        type=int,
+        help="Only list the N most recently processed filings"
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
         help="Show what would be deleted without making changes"
     )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help="Delete without asking for confirmation"
+    )
+    parser.add_argument(
+        '--backup',
+        action='store_true',
+        help="Write timestamped, gzip-compressed backups of the data files (keeps the last 5)"
+    )
     parser.add_argument(
         '--data-dir',
         default=None,
@@ -279,7 +634,7 @@ def main():
         safe_print("📋 Processed Filings with Transactions:")
         safe_print("=" * 80)
         
-        filings = deleter.list_processed_filings(args.member)
+        filings = deleter.list_processed_filings(args.member, limit=args.limit)
         
         if not filings:
             safe_print("No processed filings found.")
@@ -302,8 +657,17 @@ def main():
         safe_print(f"\n💡 To delete a filing, run:")
         safe_print(f"   python delete_filing.py --pdf-id <PDF_ID>")
         
-    elif args.pdf_id:
-        success = deleter.delete_filing(args.pdf_id, dry_run=args.dry_run)
+    elif args.pdf_id or args.pdf_ids_file:
+        pdf_ids = list(args.pdf_id or [])
+        if args.pdf_ids_file:
+            pdf_ids.extend(read_pdf_ids_file(args.pdf_ids_file))
+        
+        if len(pdf_ids) == 1:
+            success = deleter.delete_filing(pdf_ids[0], dry_run=args.dry_run, backup=args.backup,
+                                            assume_yes=args.yes)
+        else:
+            success = deleter.delete_filings(pdf_ids, dry_run=args.dry_run, backup=args.backup,
+                                             assume_yes=args.yes) > 0
         sys.exit(0 if success else 1)
         
     else:
@@ -313,6 +677,8 @@ def main():
         print(f"   python delete_filing.py --member Pelosi --list-processed")
         print(f"   python delete_filing.py --pdf-id 20026537 --dry-run")
         print(f"   python delete_filing.py --pdf-id 20026537")
+        print(f"   python delete_filing.py --pdf-ids-file ids.txt --dry-run")
+        print(f"   python delete_filing.py --pdf-ids-file ids.txt --yes")
 
 
 if __name__ == "__main__":
@@ -1,12 +1,20 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from bs4.element import Tag
+import soupsieve as sv
 from filing_status_manager import FilingStatus 
-import json
+from data_manager import DataManager
+import orjson
 import os
+import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Set 
+from itertools import chain
+from operator import itemgetter
+from typing import AbstractSet, Dict, FrozenSet, List, Optional
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -15,7 +23,22 @@ load_dotenv()
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 
+# Honorific/status markers stripped from member names when building member keys
+_NAME_CLEAN = re.compile(r"Hon\.\. |Former Member")
+
+
+@lru_cache(maxsize=4096)
+def _member_key(name: str, office: str) -> str:
+    """Build a member key; cached since the same members file repeatedly."""
+    clean_name = _NAME_CLEAN.sub("", name).strip()
+    clean_office = office.strip().replace(" ", "")
+    return f"{clean_name}_{clean_office}"
+
+
 class FilingScraper:
+    # Result-table row selector, parsed once instead of on every fetch
+    _ROW_SEL = sv.compile("tr[role='row']")
+
     def __init__(self, data_dir: str|None = None):
         # Use env var if not passed explicitly
         if data_dir is None:
@@ -25,12 +48,21 @@ class FilingScraper:
         self.base_url = "https://disclosures-clerk.house.gov"
         self.search_url = f"{self.base_url}/FinancialDisclosure/ViewMemberSearchResult"
         self.headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+
+        # Keep-alive session so retries and repeated fetches reuse the TLS connection
+        # (retries are handled by tenacity, not the adapter)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+
+        # ETag/Last-Modified from the latest fetch of each year, for conditional requests
+        self.response_validators: Dict[int, Dict] = {}
         
     def load_existing_data(self) -> Dict:
         """Load existing filings data from JSON file if exists."""
         if os.path.exists(self.data_file):
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.data_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {
             "last_updated": None,
             "members": {}
@@ -38,37 +70,62 @@ class FilingScraper:
     
     def save_data(self, data: Dict) -> None:
         """Save filings data to JSON file."""
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Same layout DataManager writes, so either can rewrite the file without churning diffs
+        with open(self.data_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=DataManager.JSON_OPTIONS))
 
-    def get_existing_pdf_urls(self, data: Dict) -> Set[str]:
+    def get_existing_pdf_urls(self, data: Dict) -> FrozenSet[str]:
         """Get set of all existing PDF URLs from congress filings data."""
-        existing_urls = set()
-        for member_data in data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                existing_urls.add(filing["pdf_link"])
-        return existing_urls
+        # Flatten all members' filings and build the set in one C-level pass
+        all_filings = chain.from_iterable(
+            member_data.get("filings", ()) for member_data in data.get("members", {}).values()
+        )
+        return frozenset(map(itemgetter("pdf_link"), all_filings))
     
     def get_member_key(self, name: str, office: str) -> str:
         """Generate a consistent key for a congress member."""
-        clean_name = name.replace("Hon.. ", "").replace("Former Member", "").strip()
-        clean_office = office.strip().replace(" ", "")
-        return f"{clean_name}_{clean_office}"
+        return _member_key(name, office)
+
+    @staticmethod
+    def _cell_text(cells: List[Tag], label_index: Dict, label: str) -> Optional[str]:
+        """Get the stripped text of a row's cell by its data-label, or None if missing."""
+        i = label_index.get(label)
+        if i is not None and i < len(cells) and cells[i].get("data-label") == label:
+            return cells[i].text.strip()
+        
+        # Row layout differs from the first data row; fall back to searching it
+        for cell in cells:
+            if cell.get("data-label") == label:
+                return cell.text.strip()
+        return None
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((requests.RequestException, requests.Timeout, ConnectionError))
     )
-    def fetch_filings(self, year: int|None = None) -> List[Dict]:
-        """Scrape filings for the specified year (defaults to current year) with retry logic."""
+    def fetch_filings(self, year: int|None = None, validators: Dict|None = None) -> Optional[List[Dict]]:
+        """
+        Scrape filings for the specified year (defaults to current year) with retry logic.
+
+        If validators ({"etag", "last_modified"} from an earlier fetch) are given, the
+        request is conditional and None is returned when the page hasn't changed.
+        Validators from a successful fetch are kept in self.response_validators[year].
+        """
         if year is None:
             year = datetime.now().year
 
         data = {"FilingYear": str(year)}
 
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
         try:
-            response = requests.post(self.search_url, data=data, headers=self.headers, timeout=30)
+            response = self.session.post(self.search_url, data=data, headers=headers, timeout=30)
             response.raise_for_status()
         except (requests.RequestException, requests.Timeout, ConnectionError) as e:
             print(f"Retryable network error during scraping: {e}")
@@ -77,64 +134,76 @@ class FilingScraper:
             print(f"Non-retryable error during scraping: {e}")
             raise Exception(f"Failed to fetch data: {e}")
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        rows = soup.select("tr[role='row']")
+        if response.status_code == 304:
+            print(f"Filings for {year} not modified since last scrape")
+            return None
+
+        self.response_validators[year] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+
+        soup = BeautifulSoup(response.text, "lxml")  # C parser; much faster than html.parser
+        rows = self._ROW_SEL.select(soup)
 
         filings = []
+        label_index = None
+        scrape_ts = datetime.now().isoformat()  # One timestamp for the whole page
         for row in rows:
             link_tag = row.find("a") # Checks whether there is an anchor tag in the row
             if not isinstance(link_tag, Tag):
                 continue
+            href = link_tag.get("href")
+            if not href:
+                continue
             
-            # Extract filing information
-            try:
-                filing_type_elem = row.find("td", {"data-label": "Filing"})
-                if not filing_type_elem:
-                    continue
-                    
-                filing_type = filing_type_elem.text.strip()
-                
-                # Filter for PTR filings (you can modify this filter as needed)
-                if "PTR" not in filing_type:
-                    continue
-                
-                link = self.base_url + "/" + str(link_tag["href"])
-                name = link_tag.text.strip() # The text of the anchor tag is the name of the congress member
-                office_elem = row.find("td", {"data-label": "Office"})
-                if not isinstance(office_elem, Tag):
-                    office = ""
-                else:
-                    office = office_elem.text.strip()
-                filing_year_elem = row.find("td", {"data-label": "Filing Year"})
-                if not isinstance(filing_year_elem, Tag):
-                    filing_year = ""
-                else:
-                    filing_year = filing_year_elem.text.strip()
-                
-                # Extract PDF ID for unique identification
-                pdf_id = link.split('/')[-1].replace('.pdf', '')
-                
-                filing = {
-                    "pdf_id": pdf_id,
-                    "name": name,
-                    "office": office,
-                    "year": filing_year,
-                    "filing_type": filing_type,
-                    "pdf_link": link,
-                    "scraped_date": datetime.now().isoformat()
-                }
-                
-                filings.append(filing)
-                
-            except Exception as e:
-                print(f"Error parsing row: {e}")
+            # Extract filing information by column position, mapped from the first data row
+            cells = row.find_all("td")
+            if label_index is None:
+                label_index = {cell.get("data-label"): i for i, cell in enumerate(cells)}
+            
+            filing_type = self._cell_text(cells, label_index, "Filing")
+            
+            # Filter for PTR filings (you can modify this filter as needed)
+            if filing_type is None or "PTR" not in filing_type:
                 continue
+            
+            link = self.base_url + "/" + str(href)
+            name = link_tag.text.strip() # The text of the anchor tag is the name of the congress member
+            office = self._cell_text(cells, label_index, "Office") or ""
+            filing_year = self._cell_text(cells, label_index, "Filing Year") or ""
+            
+            # Extract PDF ID for unique identification
+            pdf_id = link.split('/')[-1].replace('.pdf', '')
+            
+            filing = {
+                "pdf_id": pdf_id,
+                "name": name,
+                "office": office,
+                "year": filing_year,
+                "filing_type": filing_type,
+                "pdf_link": link,
+                "scraped_date": scrape_ts
+            }
+            
+            filings.append(filing)
         
         print(f"Found {len(filings)} filings")
         return filings
 
     
-    def identify_new_filings(self, current_filings: List[Dict], existing_urls: Set[str]) -> List[Dict]:
+    def fetch_filings_years(self, years: List[int], max_workers: int = 4) -> List[Dict]:
+        """
+        Scrape filings for several years concurrently over the shared session.
+
+        Concurrency is capped (4 by default) to stay polite to the disclosures site;
+        each year keeps its own tenacity retries.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.fetch_filings, years))
+        return [filing for year_filings in results for filing in year_filings]
+
+    def identify_new_filings(self, current_filings: List[Dict], existing_urls: AbstractSet[str]) -> List[Dict]:
         """Identify filings that don't already exist in the data file."""
         new_filings = []
 
@@ -145,13 +214,18 @@ class FilingScraper:
         return new_filings
 
 
-    def update_data(self, force_full_scrape: bool = False) -> Dict:
-        """Main method to update filings data and identify new filings."""
+    def update_data(self, force_full_scrape: bool = False, years: List[int]|None = None) -> Dict:
+        """
+        Main method to update filings data and identify new filings.
+
+        By default only the current year is scraped. Passing years backfills those
+        years instead (fetched concurrently, always a full scrape).
+        """
         # Load existing data
         existing_data = self.load_existing_data()
 
         # Check if 12 hours have passed since last update (unless forced)
-        if not force_full_scrape and existing_data.get("last_updated"):
+        if not force_full_scrape and not years and existing_data.get("last_updated"):
             try:
                 last_updated = datetime.fromisoformat(existing_data["last_updated"])
                 time_since_last_update = datetime.now() - last_updated
@@ -173,8 +247,20 @@ class FilingScraper:
 
         existing_urls = self.get_existing_pdf_urls(existing_data)
 
-        # Fetch current filings
-        current_filings = self.fetch_filings()
+        if years:
+            current_filings = self.fetch_filings_years(years)
+        else:
+            # Fetch current filings, conditionally if we have validators for this year
+            year = datetime.now().year
+            search_cache = existing_data.get("search_cache") or {}
+            validators = search_cache if search_cache.get("year") == year and not force_full_scrape else None
+            current_filings = self.fetch_filings(year, validators=validators)
+
+            if current_filings is None:
+                # 304 Not Modified: nothing new, skip the parse entirely
+                current_filings = []
+            elif any(self.response_validators.get(year, {}).values()):
+                existing_data["search_cache"] = {"year": year, **self.response_validators[year]}
 
         # Identify new filings
         new_filings = self.identify_new_filings(current_filings, existing_urls)
@@ -268,13 +354,15 @@ def main():
     parser = argparse.ArgumentParser(description="Scrape congressional financial disclosure filings")
     parser.add_argument("--force", action="store_true", 
                        help="Force a full scrape, bypassing the 12-hour update check")
+    parser.add_argument("--years", type=int, nargs="+",
+                       help="Backfill these filing years (fetched concurrently) instead of the current year")
     args = parser.parse_args()
     
     scraper = FilingScraper()
     
     try:
         # Update data and get summary
-        summary = scraper.update_data(force_full_scrape=args.force)
+        summary = scraper.update_data(force_full_scrape=args.force, years=args.years)
         
         # Print summary
         scraper.print_summary(summary)
@@ -5,16 +5,33 @@ This module handles all filing status transitions and validation,
 providing a clean interface for tracking processing states.
 """
 
+import atexit
+from collections import Counter
+from dataclasses import dataclass
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from enum import Enum
 
+import ijson
+
 class FilingStatus(Enum):
     """Enumeration of possible filing processing statuses."""
     PENDING = "pending"
     PROCESSED = "processed"
     FAILED = "failed"
 
+@dataclass(slots=True, frozen=True)
+class PendingFiling:
+    """A filing that still needs processing (no __dict__ per instance)."""
+    member_key: str
+    member_name: str
+    pdf_url: str
+    pdf_id: str
+    filing_type: str
+    year: str
+
+
 class FilingStatusManager:
     """
     Handles all filing status transitions and validation.
@@ -28,7 +45,16 @@ class FilingStatusManager:
     STATUS_PROCESSED = FilingStatus.PROCESSED.value
     STATUS_FAILED = FilingStatus.FAILED.value
     
-    VALID_STATUSES = {STATUS_PENDING, STATUS_PROCESSED, STATUS_FAILED}
+    VALID_STATUSES = frozenset({STATUS_PENDING, STATUS_PROCESSED, STATUS_FAILED})
+    
+    # identify_pending_filings streams congress_filings.json from this size on,
+    # unless it's already loaded
+    PENDING_STREAM_THRESHOLD = 20 * 1024 * 1024
+    
+    # Queued status updates are saved once this many accumulate, or once the
+    # oldest unsaved one is this many seconds old
+    WRITE_BEHIND_MAX_UPDATES = 50
+    WRITE_BEHIND_MAX_DELAY = 0.1
     
     def __init__(self, data_manager):
         """
@@ -38,45 +64,204 @@ class FilingStatusManager:
             data_manager: DataManager for data access operations
         """
         self.data_manager = data_manager
+        
+        # pdf_id -> (member_key, filing) and pdf_link -> filing, referencing the
+        # filing dicts of the congress data they were built from
+        self._index: Optional[Dict[str, Tuple[str, Dict]]] = None
+        self._link_index: Optional[Dict[str, Dict]] = None
+        self._index_source: Optional[Dict] = None
+        
+        # Status updates queued with queue_status_update but not yet saved, as
+        # (filing_id, status, error_message, timestamp), and the congress data
+        # they are currently applied to
+        self._queued_updates: List[Tuple[str, FilingStatus, Optional[str], str]] = []
+        self._queued_source: Optional[Dict] = None
+        self._queued_since = 0.0
+
+    def __enter__(self) -> "FilingStatusManager":
+        return self
 
-    def identify_pending_filings(self) -> List[Dict]:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+    def _get_data(self) -> Dict:
         """
-        Identify all filings that need processing.
+        Get the congress filings data.
         
-        Returns filings with status "pending" or no status (legacy data).
+        DataManager keeps the parsed data cached until the file changes on disk
+        (checked with a single stat), so repeated calls within a run share one
+        parse and one dictionary; the indexes below are reused along with it.
+        If the file was rewritten while status updates are queued, the queued
+        updates are re-applied to the freshly loaded data.
         
         Returns:
-            List of filing dictionaries that need processing
+            Congress filings data (shared, mutable)
         """
         congress_data = self.data_manager.load_congress_data()
-        pending_filings = []
+        if self._queued_updates and congress_data is not self._queued_source:
+            self._reapply_queued(congress_data)
+        return congress_data
+
+    def _reapply_queued(self, congress_data: Dict) -> None:
+        """
+        Apply the queued status updates to reloaded congress data.
+        
+        Updates for filings that are no longer in the data are dropped.
+        
+        Args:
+            congress_data: Congress filings data loaded from disk
+        """
+        kept = []
+        for filing_id, status, error_message, timestamp in self._queued_updates:
+            filing = self._lookup(congress_data, filing_id)
+            if filing is None:
+                print(f"Dropping queued status update for {filing_id}: filing no longer exists")
+                continue
+            self._set_status(filing, status, error_message, timestamp)
+            kept.append((filing_id, status, error_message, timestamp))
+        
+        self._queued_updates = kept
+        self._queued_source = congress_data if kept else None
+
+    def _save_data(self, congress_data: Dict) -> None:
+        """
+        Save congress filings data after in-place status changes.
+        
+        DataManager keeps the saved dictionary as its cache, so the next
+        _get_data() returns it without re-reading the file.
+        
+        Args:
+            congress_data: Congress filings data to save
+        """
+        self.data_manager.save_congress_data(congress_data, metadata_dirty=False)
+        # congress_data came from _get_data(), which applies any queued updates, so they're saved too
+        self._clear_queue()
+
+    def _clear_queue(self) -> None:
+        """Forget queued status updates (after they were saved)."""
+        if self._queued_updates:
+            self._queued_updates = []
+            atexit.unregister(self.flush)
+        self._queued_source = None
+
+    def invalidate(self) -> None:
+        """
+        Drop cached data and indexes.
+        
+        Call this after congress_filings.json was modified outside the shared
+        DataManager in a way that might not change its mtime or size.
+        """
+        self._index = None
+        self._link_index = None
+        self._index_source = None
+        self.data_manager.invalidate_caches()
+
+    def _ensure_index(self, congress_data: Dict, rebuild: bool = False) -> None:
+        """
+        Build the pdf_id and pdf_link indexes for congress_data if needed.
+        
+        The indexes are reused for as long as DataManager hands back the same
+        (cached) congress data, so lookups don't scan every member's filings.
+        
+        Args:
+            congress_data: Loaded congress filings data
+            rebuild: Rebuild even if the indexes were built from congress_data
+        """
+        if not rebuild and self._index is not None and self._index_source is congress_data:
+            return
         
+        index = {}
+        link_index = {}
         for member_key, member_data in congress_data.get("members", {}).items():
             for filing in member_data.get("filings", []):
-                processing_status = filing.get("processing_status")
-                
-                # Determine if this filing needs processing:
-                # 1. No processing_status field (legacy data)
-                # 2. processing_status is "pending"
-                needs_processing = (
-                    processing_status is None or 
-                    processing_status == self.STATUS_PENDING
-                )
-                
-                if needs_processing:
-                    filing_info = {
-                        "member_key": member_key,
-                        "member_name": member_data["name"],
-                        "pdf_url": filing["pdf_link"],
-                        "pdf_id": filing["pdf_id"],
-                        "filing_type": filing["filing_type"],
-                        "year": filing["year"],
-                        # "filing": filing  # Include full filing for updates
-                    }
-                    pending_filings.append(filing_info)
+                index[filing["pdf_id"]] = (member_key, filing)
+                link_index[filing["pdf_link"]] = filing
+        
+        self._index = index
+        self._link_index = link_index
+        self._index_source = congress_data
+
+    def _lookup(self, congress_data: Dict, filing_id: str) -> Optional[Dict]:
+        """
+        Find a filing by pdf_id through the index.
+        
+        Args:
+            congress_data: Loaded congress filings data
+            filing_id: Filing ID to look up
+            
+        Returns:
+            The filing dictionary (mutable, part of congress_data) or None if not found
+        """
+        self._ensure_index(congress_data)
+        entry = self._index.get(filing_id)
+        if entry is None or entry[1].get("pdf_id") != filing_id:
+            # congress_data may have been modified in place since the index was built
+            self._ensure_index(congress_data, rebuild=True)
+            entry = self._index.get(filing_id)
+        return entry[1] if entry is not None else None
+
+    def identify_pending_filings(self) -> List[PendingFiling]:
+        """
+        Identify all filings that need processing.
+        
+        Returns filings with status "pending" or no status (legacy data).
+        Very large congress files that aren't loaded yet are streamed instead.
+        
+        Returns:
+            List of PendingFiling records that need processing
+        """
+        if (not self._queued_updates and
+                self.data_manager.should_stream_congress(self.PENDING_STREAM_THRESHOLD)):
+            pending_filings = list(self.identify_pending_filings_streaming())
+        else:
+            congress_data = self._get_data()
+            pending_filings = list(self._iter_pending(congress_data.get("members", {}).items()))
         
         print(f"Identified {len(pending_filings)} pending filings")
         return pending_filings
+
+    def identify_pending_filings_streaming(self) -> Iterator[PendingFiling]:
+        """
+        Yield filings that need processing, stream-parsing congress_filings.json.
+        
+        Only one member's data is materialized at a time, so peak memory stays
+        small however large the file is. Reads the file on disk, not unsaved
+        in-memory changes.
+        
+        Yields:
+            PendingFiling records that need processing
+        """
+        try:
+            with open(self.data_manager.congress_file_str, 'rb') as f:
+                yield from self._iter_pending(ijson.kvitems(f, "members", use_float=True))
+        except FileNotFoundError:
+            return
+
+    def _iter_pending(self, members: Iterable[Tuple[str, Dict]]) -> Iterator[PendingFiling]:
+        """
+        Yield the filings of (member_key, member_data) pairs that need processing.
+        
+        Args:
+            members: (member_key, member_data) pairs
+            
+        Yields:
+            PendingFiling records that need processing
+        """
+        # Needs processing: no processing_status field (legacy data) or "pending"
+        needs_processing = (None, self.STATUS_PENDING)
+        
+        for member_key, member_data in members:
+            member_name = member_data["name"]
+            for filing in member_data.get("filings", []):
+                if filing.get("processing_status") in needs_processing:
+                    yield PendingFiling(
+                        member_key=member_key,
+                        member_name=member_name,
+                        pdf_url=filing["pdf_link"],
+                        pdf_id=filing["pdf_id"],
+                        filing_type=filing["filing_type"],
+                        year=filing["year"],
+                    )
     
     def get_failed_filings(self) -> List[str]:
         """
@@ -85,15 +270,15 @@ class FilingStatusManager:
         Returns:
             List of filing IDs that failed processing
         """
-        congress_data = self.data_manager.load_congress_data()
-        failed_filings = []
-        
-        for member_data in congress_data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                if filing.get("processing_status") == self.STATUS_FAILED:
-                    failed_filings.append(filing["pdf_id"])
+        congress_data = self._get_data()
+        status_failed = self.STATUS_FAILED
         
-        return failed_filings
+        return [
+            filing["pdf_id"]
+            for member_data in congress_data.get("members", {}).values()
+            for filing in member_data.get("filings", [])
+            if filing.get("processing_status") == status_failed
+        ]
     
     def update_status(self, filing_id: str, status: FilingStatus, error_message: Optional[str] = None) -> None:
         """
@@ -104,32 +289,122 @@ class FilingStatusManager:
             status: New FilingStatus
             error_message: Optional error message if status is FAILED
         """
-        if status not in FilingStatus:
-            raise ValueError(f"Invalid status: {status}")
+        self.update_statuses([(filing_id, status, error_message)])
+
+    def update_statuses(self, updates: List[Tuple[str, FilingStatus, Optional[str]]]) -> int:
+        """
+        Update the status of several filings with one load and one save.
         
-        congress_data = self.data_manager.load_congress_data()
-        updated = False
+        Either every update is applied or, if any filing ID is unknown, none are.
         
-        # Find and update the filing
-        for member_data in congress_data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                if filing["pdf_id"] == filing_id:
-                    filing["processing_status"] = status.value
-                    filing["status_updated"] = datetime.now().isoformat()
-                    
-                    if error_message:
-                        filing["error"] = error_message
-                    
-                    updated = True
-                    break
-            if updated:
-                break
-        
-        if updated:
-            self.data_manager.save_congress_data(congress_data)
-            print(f"Updated filing {filing_id} status to {status.value}")
-        else:
-            raise KeyError(f"Filing ID {filing_id} not found in data")
+        Args:
+            updates: (filing_id, status, error_message) tuples; error_message may be None
+            
+        Returns:
+            Number of filings updated
+        """
+        congress_data = self._apply_statuses(updates)
+        
+        if updates:
+            self._save_data(congress_data)
+            for filing_id, status, _ in updates:
+                print(f"Updated filing {filing_id} status to {status.value}")
+        
+        return len(updates)
+
+    def queue_status_update(self, filing_id: str, status: FilingStatus,
+                            error_message: Optional[str] = None) -> None:
+        """
+        Update filing status in memory and defer the save (write-behind).
+        
+        The change is visible to this manager's reads right away; saves are
+        coalesced and happen once WRITE_BEHIND_MAX_UPDATES updates are queued,
+        when a queued update is older than WRITE_BEHIND_MAX_DELAY seconds (checked
+        on the next call), or on flush(). Call flush() when done, or use the
+        manager as a context manager; anything still queued is also flushed at
+        interpreter exit. If congress_filings.json is rewritten in the meantime,
+        the queued updates are applied to the new contents rather than saving
+        over them.
+        
+        Args:
+            filing_id: Filing ID to update
+            status: New FilingStatus
+            error_message: Optional error message if status is FAILED
+        """
+        now = datetime.now().isoformat()
+        congress_data = self._apply_statuses([(filing_id, status, error_message)], now=now)
+        
+        if not self._queued_updates:
+            self._queued_since = time.monotonic()
+            atexit.register(self.flush)
+        self._queued_updates.append((filing_id, status, error_message, now))
+        self._queued_source = congress_data
+        
+        if (len(self._queued_updates) >= self.WRITE_BEHIND_MAX_UPDATES or
+                time.monotonic() - self._queued_since >= self.WRITE_BEHIND_MAX_DELAY):
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Save status updates queued with queue_status_update.
+        
+        Returns:
+            Number of queued updates that were saved
+        """
+        if not self._queued_updates:
+            return 0
+        
+        # Reload if the file changed since the updates were queued, so they're
+        # saved on top of the current contents
+        congress_data = self._get_data()
+        count = len(self._queued_updates)
+        if count:
+            self._save_data(congress_data)
+            print(f"Saved {count} queued status updates")
+        return count
+
+    def _apply_statuses(self, updates: List[Tuple[str, FilingStatus, Optional[str]]],
+                        now: Optional[str] = None) -> Dict:
+        """
+        Apply status updates to the loaded congress data, without saving.
+        
+        Either every update is applied or, if any filing ID is unknown, none are.
+        
+        Args:
+            updates: (filing_id, status, error_message) tuples; error_message may be None
+            now: ISO timestamp to record (defaults to the current time)
+            
+        Returns:
+            The updated congress data
+        """
+        for _, status, _ in updates:
+            if status not in FilingStatus:
+                raise ValueError(f"Invalid status: {status}")
+        
+        congress_data = self._get_data()
+        
+        # Find every filing before changing any of them
+        filings = [self._lookup(congress_data, filing_id) for filing_id, _, _ in updates]
+        missing = [filing_id for (filing_id, _, _), filing in zip(updates, filings) if filing is None]
+        if missing:
+            if len(missing) == 1:
+                raise KeyError(f"Filing ID {missing[0]} not found in data")
+            raise KeyError(f"Filing IDs {', '.join(missing)} not found in data")
+        
+        now = now or datetime.now().isoformat()  # One timestamp for the whole batch
+        for (filing_id, status, error_message), filing in zip(updates, filings):
+            self._set_status(filing, status, error_message, now)
+        
+        return congress_data
+
+    @staticmethod
+    def _set_status(filing: Dict, status: FilingStatus, error_message: Optional[str], now: str) -> None:
+        """Record a status change on a filing dict."""
+        filing["processing_status"] = status.value
+        filing["status_updated"] = now
+        
+        if error_message:
+            filing["error"] = error_message
 
     def get_status(self, filing_id: str) -> Optional[FilingStatus]:
         """
@@ -141,45 +416,50 @@ class FilingStatusManager:
         Returns:
             Current FilingStatus or None if filing not found
         """
-        congress_data = self.data_manager.load_congress_data()
+        congress_data = self._get_data()
         
-        for member_data in congress_data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                if filing["pdf_id"] == filing_id:
-                    status_str = filing.get("processing_status")
-                    if status_str:
-                        try:
-                            return FilingStatus(status_str)
-                        except ValueError:
-                            return None
-                    return None
+        filing = self._lookup(congress_data, filing_id)
+        if filing is None:
+            return None
         
+        status_str = filing.get("processing_status")
+        if status_str:
+            try:
+                return FilingStatus(status_str)
+            except ValueError:
+                return None
         return None
 
-    def mark_filings_as_pending(self, pdf_urls: List[str]) -> int:
+    def mark_filings_as_pending(self, pdf_urls: Iterable[str]) -> int:
         """
         Mark multiple filings as pending if they have no status. New filings are set to pending by default.
         
         Args:
-            pdf_urls: List of PDF URLs to mark as pending
+            pdf_urls: PDF URLs to mark as pending (any iterable; a set is used as-is)
             
         Returns:
             Number of filings updated
         """
-        congress_data = self.data_manager.load_congress_data()
+        congress_data = self._get_data()
+        self._ensure_index(congress_data)
         updated_count = 0
         
-        for member_data in congress_data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                if (filing["pdf_link"] in pdf_urls and 
-                    filing.get("processing_status") is None):
-                    
-                    filing["processing_status"] = self.STATUS_PENDING
-                    filing["status_updated"] = datetime.now().isoformat()
-                    updated_count += 1
+        if not isinstance(pdf_urls, (set, frozenset)):
+            pdf_urls = set(pdf_urls)  # Also drops duplicates
+        if not pdf_urls <= self._link_index.keys():
+            # Filings may have been added to congress_data in place since the index was built
+            self._ensure_index(congress_data, rebuild=True)
+        
+        now = datetime.now().isoformat()  # One timestamp for the whole batch
+        for pdf_url in pdf_urls:
+            filing = self._link_index.get(pdf_url)
+            if filing is not None and filing.get("processing_status") is None:
+                filing["processing_status"] = self.STATUS_PENDING
+                filing["status_updated"] = now
+                updated_count += 1
         
         if updated_count > 0:
-            self.data_manager.save_congress_data(congress_data)
+            self._save_data(congress_data)
             print(f"Marked {updated_count} filings as pending")
         
         return updated_count
@@ -192,21 +472,20 @@ class FilingStatusManager:
         Returns:
             Dictionary with counts for each status
         """
-        congress_data = self.data_manager.load_congress_data()
+        congress_data = self._get_data()
+        
+        # One C-level tally of raw status values
+        counts = Counter(
+            filing.get("processing_status")
+            for member_data in congress_data.get("members", {}).values()
+            for filing in member_data.get("filings", [])
+        )
         summary = {
-            self.STATUS_PENDING: 0,
-            self.STATUS_PROCESSED: 0,
-            self.STATUS_FAILED: 0,
-            "no_status": 0
+            status: counts[status]
+            for status in (self.STATUS_PENDING, self.STATUS_PROCESSED, self.STATUS_FAILED)
         }
-        
-        for member_data in congress_data.get("members", {}).values():
-            for filing in member_data.get("filings", []):
-                status = filing.get("processing_status")
-                if status in summary:
-                    summary[status] += 1
-                else:
-                    summary["no_status"] += 1
+        # Missing and unrecognized statuses both count as no_status
+        summary["no_status"] = sum(counts.values()) - sum(summary.values())
         
         return summary
 
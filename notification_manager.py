@@ -8,22 +8,109 @@ and integration with the existing system components.
 
 import asyncio
 import aiohttp
+import hashlib
 import os
+import random
 import time
-from typing import Optional, Dict, Any
-from urllib.parse import quote, urljoin
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import ClassVar, Deque, Optional, Dict, Any, List, Tuple
+from urllib.parse import quote, urlencode, urljoin
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 
 from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from .env file
 
-@dataclass
+@dataclass(slots=True)
 class NotificationRequest:
-    """Simple notification request."""
+    """
+    Simple notification request.
+    
+    For bursts of notifications, use acquire() to reuse pooled instances;
+    send_notification returns acquired requests to the pool.
+    """
     title: str
     body: str
     subtitle: Optional[str] = None
     url: Optional[str] = None  # URL to jump to when notification is clicked
+    _pooled: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    _pool: ClassVar[Deque["NotificationRequest"]] = deque(maxlen=64)
+    
+    def reset(self, title: str, body: str, subtitle: Optional[str] = None,
+              url: Optional[str] = None) -> "NotificationRequest":
+        """Overwrite all fields in place."""
+        self.title = title
+        self.body = body
+        self.subtitle = subtitle
+        self.url = url
+        return self
+    
+    @classmethod
+    def acquire(cls, title: str, body: str, subtitle: Optional[str] = None,
+                url: Optional[str] = None) -> "NotificationRequest":
+        """
+        Get a request from the pool (or a new one) initialized with these fields.
+        
+        Don't keep references to an acquired request after passing it to
+        send_notification or release(); it will be reused.
+        """
+        try:
+            request = cls._pool.pop().reset(title, body, subtitle, url)
+        except IndexError:
+            request = cls(title, body, subtitle, url)
+        request._pooled = True
+        return request
+    
+    @classmethod
+    def release(cls, request: "NotificationRequest") -> None:
+        """Clear an acquired request and return it to the pool."""
+        if not request._pooled:
+            return  # Caller-constructed requests are left alone
+        request._pooled = False
+        request.reset("", "")
+        cls._pool.append(request)
+
+
+class RetriableError(Exception):
+    """A send failed in a way that may succeed if retried."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Seconds the server asked us to wait, if any
+
+
+class TerminalError(Exception):
+    """A send failed in a way that retrying won't fix (e.g. a 4xx response)."""
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_cached(content: str, max_length: int) -> str:
+    """Normalize line endings and truncate; cached since titles and subtitles repeat."""
+    # Basic sanitization (most content has no carriage returns; skip the copies then)
+    sanitized = content
+    if '\r' in sanitized:
+        sanitized = sanitized.replace('\r\n', '\n').replace('\r', '\n')
+    
+    # Truncate if too long
+    if len(sanitized) <= max_length:
+        return sanitized
+    return sanitized[:max_length-3] + "..."
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
 
 @dataclass
@@ -34,6 +121,15 @@ class NotificationResponse:
     timestamp: Optional[str] = None
 
 
+# ClientSessions shared by every NotificationManager with the same base URL and
+# timeout, so connections (and TLS sessions) to the Bark server stay warm across
+# managers. Sessions are bound to an event loop, so the loop is part of the key.
+_SessionKey = Tuple[str, int, asyncio.AbstractEventLoop]
+_SHARED_SESSIONS: Dict[_SessionKey, aiohttp.ClientSession] = {}
+# Number of managers currently using each shared session as a context manager
+_SESSION_USERS: Dict[_SessionKey, int] = {}
+
+
 class NotificationManager:
     """
     Minimal manager for sending notifications via Bark API.
@@ -41,8 +137,21 @@ class NotificationManager:
     Supports both GET and POST requests with basic retry logic.
     """
     
+    # Retry delays: random in [0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)] seconds
+    BACKOFF_BASE = 1.0
+    BACKOFF_CAP = 30.0
+    # Statuses that mean "slow down", for which Retry-After is honored
+    THROTTLE_STATUSES = frozenset({429, 503})
+    # Connection pool of the shared session: enough keep-alive connections for a
+    # send_notifications batch, kept open between bursts, with DNS answers cached
+    MAX_CONNECTIONS = 8
+    KEEPALIVE_TIMEOUT = 60
+    DNS_CACHE_TTL = 300
+    # Maximum number of recently sent notifications remembered for duplicate detection
+    DEDUPE_MAX_ENTRIES = 512
+    
     def __init__(self, api_key: str|None = None, base_url: str|None = None, 
-                 max_retries: int = 3, timeout: int = 30):
+                 max_retries: int = 3, timeout: int = 30, dedupe_window: float|None = None):
         if api_key is None:
             api_key = os.getenv("BARK_API_KEY", "")
         self.api_key = api_key
@@ -54,13 +163,29 @@ class NotificationManager:
         # Load notification icon from environment
         self.notification_icon = os.getenv("NOTIFICATION_ICON")
         
+        # The key never changes, so encode it (and the POST endpoint, which is also
+        # the prefix of every GET URL) once
+        self._encoded_key = quote(self.api_key, safe='')
+        self._post_endpoint = urljoin(self.base_url, f"/{self._encoded_key}")
+        
         self.max_retries = max_retries
         self.timeout = timeout
         self._session: Optional[aiohttp.ClientSession] = None
+        self._session_key: Optional[_SessionKey] = None
+        self._entered = False
+        
+        # Identical notifications sent within this many seconds are skipped (0 disables)
+        if dedupe_window is None:
+            dedupe_window = float(os.getenv("NOTIFICATION_DEDUPE_WINDOW", "300"))
+        self.dedupe_window = dedupe_window
+        # Digest of recently sent notifications -> monotonic send time, oldest first
+        self._recent: "OrderedDict[bytes, float]" = OrderedDict()
     
     async def __aenter__(self):
         """Async context manager entry."""
         await self._ensure_session()
+        _SESSION_USERS[self._session_key] = _SESSION_USERS.get(self._session_key, 0) + 1
+        self._entered = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -68,29 +193,69 @@ class NotificationManager:
         await self._close_session()
     
     async def _ensure_session(self):
-        """Ensure aiohttp session is available."""
-        if self._session is None or self._session.closed:
+        """Ensure aiohttp session is available, reusing the shared one for this server."""
+        if self._session is not None and not self._session.closed:
+            return
+        
+        # Forget sessions left behind by event loops that have since been closed
+        for stale_key in [k for k in _SHARED_SESSIONS if k[2].is_closed()]:
+            _SHARED_SESSIONS.pop(stale_key)
+            _SESSION_USERS.pop(stale_key, None)
+        
+        key = (self.base_url, self.timeout, asyncio.get_running_loop())
+        session = _SHARED_SESSIONS.get(key)
+        if session is None or session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+            )
+            session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+            _SHARED_SESSIONS[key] = session
+        self._session = session
+        self._session_key = key
     
     async def _close_session(self):
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release the shared session, closing it once no other manager is using it."""
+        key = self._session_key
+        if key is None:
+            return
+        
+        if self._entered:
+            self._entered = False
+            _SESSION_USERS[key] -= 1
+        if _SESSION_USERS.get(key, 0) > 0:
+            return  # Still in use by another manager
+        
+        _SESSION_USERS.pop(key, None)
+        session = _SHARED_SESSIONS.pop(key, None)
+        if session and not session.closed:
+            await session.close()
+        self._session = None
+        self._session_key = None
+    
+    @staticmethod
+    async def shutdown_all():
+        """
+        Close every shared session belonging to the running event loop.
+        
+        Call this before the loop ends if managers were used without
+        `async with` or cleanup().
+        """
+        loop = asyncio.get_running_loop()
+        for key in [key for key in _SHARED_SESSIONS if key[2] is loop]:
+            _SESSION_USERS.pop(key, None)
+            session = _SHARED_SESSIONS.pop(key)
+            if not session.closed:
+                await session.close()
     
     def _sanitize_content(self, content: str, max_length: int = 500) -> str:
         """Sanitize and truncate content."""
         if not content:
             return ""
         
-        # Basic sanitization
-        sanitized = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Truncate if too long
-        if len(sanitized) > max_length:
-            sanitized = sanitized[:max_length-3] + "..."
-        
-        return sanitized
+        return _sanitize_cached(content, max_length)
     
     def _build_get_url(self, title: str, subtitle: Optional[str], body: str, url: Optional[str] = None) -> str:
         """Build URL for GET request."""
@@ -98,38 +263,37 @@ class NotificationManager:
             raise ValueError("API key is required")
         
         # URL-encode components
-        encoded_key = quote(self.api_key, safe='')
         encoded_title = quote(title, safe='')
         encoded_body = quote(body, safe='')
         
         if subtitle:
             encoded_subtitle = quote(subtitle, safe='')
-            path = f"/{encoded_key}/{encoded_title}/{encoded_subtitle}/{encoded_body}"
+            full_url = f"{self._post_endpoint}/{encoded_title}/{encoded_subtitle}/{encoded_body}"
         else:
-            path = f"/{encoded_key}/{encoded_title}/{encoded_body}"
-        
-        full_url = urljoin(self.base_url, path)
+            full_url = f"{self._post_endpoint}/{encoded_title}/{encoded_body}"
         
         # Add parameters
-        params = []
+        params: List[Tuple[str, str]] = []
         if url:
-            params.append(f"url={quote(url, safe='')}")
+            params.append(("url", url))
         if self.notification_icon:
-            params.append(f"icon={quote(self.notification_icon, safe='')}")
+            params.append(("icon", self.notification_icon))
         
         if params:
-            full_url += "?" + "&".join(params)
+            full_url += "?" + urlencode(params, safe='', quote_via=quote)
         
         return full_url
     
     async def send_notification(self, request: NotificationRequest, 
-                              use_post: bool = True) -> NotificationResponse:
+                              use_post: bool = True, dedupe: bool = True) -> NotificationResponse:
         """
         Send a notification.
         
         Args:
             request: The notification to send
             use_post: Whether to use POST (True) or GET (False) method
+            dedupe: Whether to skip the notification if an identical one was sent
+                within the dedupe window
         
         Returns:
             NotificationResponse with success status
@@ -141,9 +305,16 @@ class NotificationManager:
         subtitle = self._sanitize_content(request.subtitle) if request.subtitle else None
         body = self._sanitize_content(request.body)
         url = request.url  # URLs don't need sanitization, just validation
+        # Everything needed is copied out, so a pooled request can be reused already
+        NotificationRequest.release(request)
         
         timestamp = time.strftime('%Y-%m-%dT%H:%M:%S')
         
+        digest = self._notification_digest(title, subtitle, body, url)
+        if dedupe and self._is_duplicate(digest):
+            print(f"Skipping duplicate notification: {title}")
+            return NotificationResponse(success=True, timestamp=timestamp)
+        
         for attempt in range(self.max_retries + 1):
             try:
                 if use_post:
@@ -153,12 +324,16 @@ class NotificationManager:
                 
                 if response:
                     print(f"Notification sent successfully: {title}")
+                    self._remember_sent(digest)
                     return NotificationResponse(success=True, timestamp=timestamp)
                 
+            except TerminalError as e:
+                print(f"Notification failed, not retrying: {e}")
+                return NotificationResponse(success=False, error=str(e), timestamp=timestamp)
             except Exception as e:
                 print(f"Notification attempt {attempt + 1} failed: {e}")
                 if attempt < self.max_retries:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(self._retry_delay(attempt, e))
                 else:
                     return NotificationResponse(
                         success=False, 
@@ -172,16 +347,109 @@ class NotificationManager:
             timestamp=timestamp
         )
     
+    @staticmethod
+    def _notification_digest(title: str, subtitle: Optional[str], body: str, url: Optional[str]) -> bytes:
+        """Hash the sanitized notification content for duplicate detection."""
+        key = f"{title}\x1f{subtitle or ''}\x1f{body}\x1f{url or ''}".encode()
+        return hashlib.blake2b(key, digest_size=16).digest()
+    
+    def _is_duplicate(self, digest: bytes) -> bool:
+        """Check whether the same notification was sent within the dedupe window."""
+        if self.dedupe_window <= 0:
+            return False
+        
+        # Entries are in send order, so expired ones are all at the front
+        cutoff = time.monotonic() - self.dedupe_window
+        recent = self._recent
+        while recent and next(iter(recent.values())) < cutoff:
+            recent.popitem(last=False)
+        
+        return digest in recent
+    
+    def _remember_sent(self, digest: bytes) -> None:
+        """Record a successfully sent notification for duplicate detection."""
+        if self.dedupe_window <= 0:
+            return
+        
+        self._recent[digest] = time.monotonic()
+        self._recent.move_to_end(digest)
+        if len(self._recent) > self.DEDUPE_MAX_ENTRIES:
+            self._recent.popitem(last=False)
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """
+        Seconds to wait before the next attempt.
+        
+        Uses the server's Retry-After when it gave one, otherwise exponential
+        backoff with full jitter so concurrent retries don't all land on the
+        server at the same moment.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            error: The exception that attempt raised
+        
+        Returns:
+            Delay in seconds
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.BACKOFF_CAP)
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt))
+    
+    def _check_status(self, response: aiohttp.ClientResponse) -> None:
+        """
+        Classify a response by its status code.
+        
+        Raises:
+            RetriableError: For throttling (with the server's Retry-After), 5xx
+                and other unexpected statuses
+            TerminalError: For 4xx client errors, which won't succeed on retry
+        """
+        status = response.status
+        if 200 <= status < 300:
+            return
+        if status in self.THROTTLE_STATUSES:
+            raise RetriableError(
+                f"HTTP {status}",
+                retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+            )
+        if 400 <= status < 500:
+            raise TerminalError(f"HTTP {status}")
+        raise RetriableError(f"HTTP {status}")
+    
+    async def send_notifications(self, requests: List[NotificationRequest], use_post: bool = True,
+                                 concurrency: int = MAX_CONNECTIONS) -> List[NotificationResponse]:
+        """
+        Send several notifications concurrently over the shared session.
+        
+        Args:
+            requests: The notifications to send
+            use_post: Whether to use POST (True) or GET (False) method
+            concurrency: Maximum number of notifications in flight at once
+        
+        Returns:
+            NotificationResponses in the same order as requests
+        """
+        await self._ensure_session()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def send_one(request: NotificationRequest) -> NotificationResponse:
+            async with semaphore:
+                return await self.send_notification(request, use_post=use_post)
+        
+        return await asyncio.gather(*(send_one(request) for request in requests))
+    
     async def _send_get(self, title: str, subtitle: Optional[str], body: str, url: Optional[str] = None) -> bool:
         """Send notification via GET request."""
         full_url = self._build_get_url(title, subtitle, body, url)
         
         async with self._session.get(full_url) as response:
-            return response.status == 200
+            self._check_status(response)
+            return True
     
     async def _send_post(self, title: str, subtitle: Optional[str], body: str, url: Optional[str] = None) -> bool:
         """Send notification via POST request."""
-        endpoint_url = urljoin(self.base_url, f"/{quote(self.api_key, safe='')}")
+        endpoint_url = self._post_endpoint
         
         data = {"title": title, "body": body}
         if subtitle:
@@ -192,17 +460,18 @@ class NotificationManager:
             data["icon"] = self.notification_icon
         
         async with self._session.post(endpoint_url, json=data) as response:
-            return response.status == 200
+            self._check_status(response)
+            return True
     
     async def test_connection(self) -> bool:
         """Test the connection with a simple notification."""
-        test_request = NotificationRequest(
+        test_request = NotificationRequest.acquire(
             title="Test",
             body="Connection test"
         )
         
         try:
-            response = await self.send_notification(test_request)
+            response = await self.send_notification(test_request, dedupe=False)
             return response.success
         except Exception as e:
             print(f"Connection test failed: {e}")
@@ -3,48 +3,274 @@ Congressional Trading Transaction Extractor
 Modular extraction of trading transaction data from congressional disclosure filings.
 """
 
+import asyncio
 import json
+import multiprocessing
 import re
 import os
+import threading
+import aiohttp
 import pdfplumber
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTTextContainer, LTTextLine
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 import tempfile
 import shutil
-from typing import List, Dict, Optional, Tuple
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import BinaryIO, List, Dict, Iterable, Iterator, Optional, Tuple, Union
 
+try:
+    import pypdfium2 as pdfium  # Optional: fastest page text extraction (PDF_TEXT_ENGINE=pdfium)
+except ImportError:
+    pdfium = None
 # Add retry logic
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+# Configuration constants
+_OWNER_CODES = {
+    "SP": "Spouse",
+    "DC": "Dependent Child", 
+    "JT": "Joint"
+}
+
+_AMOUNT_RANGES = (
+    (15000, "$1,001 - $15,000"),
+    (50000, "$15,001 - $50,000"),
+    (100000, "$50,001 - $100,000"),
+    (250000, "$100,001 - $250,000"),
+    (500000, "$250,001 - $500,000"),
+    (1000000, "$500,001 - $1,000,000"),
+    (5000000, "$1,000,001 - $5,000,000"),
+    (25000000, "$5,000,001 - $25,000,000"),
+    (50000000, "$25,000,001 - $50,000,000"),
+    (100000000, "Over $50,000,000")
+)
+# Upper bounds and labels of _AMOUNT_RANGES, for binary search
+_AMOUNT_THRESHOLDS = tuple(threshold for threshold, _ in _AMOUNT_RANGES)
+_AMOUNT_LABELS = tuple(label for _, label in _AMOUNT_RANGES)
+
+# Patterns used on every page/line, compiled once
+_FILING_ID_RE = re.compile(r'Filing ID #(\d+)')
+_NAME_RE = re.compile(r'Name: (.+?)(?:\n|Status:)')
+_DISTRICT_RE = re.compile(r'State/District: (.+?)(?:\n|$)')
+_TICKER_RE = re.compile(r'\(([A-Z0-9.]+)\)')
+# Transaction type marker (P, S or E) that ends the asset name on the primary line. Only the
+# single whitespace before the letter is matched (\s+ would rescan whitespace runs from every
+# start position); the rest of the run is stripped off the asset name anyway.
+_TRANSACTION_MARKER_RE = re.compile(r'\s[PSE]\s')
+# Secondary cutoff markers (in overflow lines, looks for dates, financial amounts - e.g., "$1", "$ 1", "- $")
+_SECONDARY_CUTOFF_RE = re.compile(r'\d{2}/\d{2}/\d{4}|\$\s*\d|-\s*\$')
+# Runs of special characters and/or whitespace, collapsed to a single space. Brackets are
+# special characters, so "[ST]"-style annotations are reduced to their letters here too.
+_ASSET_CLEAN_RE = re.compile(r'(?:[^\w\s.\-&(),]|\s)+')
+_DATE_RE = re.compile(r'\d{2}/\d{2}/\d{4}')
+_AMOUNT_RE = re.compile(r'\$[\d,]+')
+_DIGITS = frozenset('0123456789')
+
+
+@lru_cache(maxsize=4096)
+def _clean_asset_name_cached(asset_name: str) -> str:
+    """Remove special characters and normalize whitespace; cached since assets repeat across filings."""
+    return _ASSET_CLEAN_RE.sub(' ', asset_name).strip()
+
+
+@lru_cache(maxsize=4096)
+def _categorize_amount_cached(amount: str) -> str:
+    """Map a "$1,234"-style amount to its standard range; cached since amounts repeat on most lines."""
+    try:
+        # Convert to integer for range mapping
+        amount_value = int(amount.replace('$', '').replace(',', ''))
+    except ValueError:
+        return amount  # Fall back to raw match
+
+    # Map to fixed ranges
+    if amount_value < 1000:
+        return f"${amount_value:,}"  # Exact amount for < $1K
+
+    # First range whose threshold is >= the amount
+    index = bisect_left(_AMOUNT_THRESHOLDS, amount_value)
+    if index < len(_AMOUNT_LABELS):
+        return _AMOUNT_LABELS[index]
+
+    return "Over $50,000,000"
+
+
+def pool_mp_context():
+    """
+    Multiprocessing context for the extraction and page pools.
+
+    Pool workers are started lazily, from inside the running event loop, when aiohttp's
+    resolver and the default executor already have threads running. Forking a
+    multi-threaded process can deadlock the child, so start workers from a clean
+    forkserver process instead (or spawn them where forkserver isn't available).
+
+    Returns:
+        multiprocessing context
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _page_text(page) -> str:
+    """Extract a pdfplumber page's text, then free the layout objects cached on the page"""
+    text = page.extract_text() or ""
+    # Page.close (pdfplumber >= 0.10) also clears the cached text map; older versions can only flush
+    getattr(page, "close", page.flush_cache)()
+    return text
+
+
+def _extract_page_texts(pdf_source: Union[str, bytes], start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) of a PDF. Runs in a page pool worker, so it
+    reopens the PDF itself (pdfplumber objects can't be pickled).
+
+    Args:
+        pdf_source: Path to PDF file, or the PDF's bytes
+        start: Index of the first page
+        stop: Index after the last page
+
+    Returns:
+        Page texts in page order ("" for pages without text)
+    """
+    if isinstance(pdf_source, bytes):
+        pdf_source = BytesIO(pdf_source)
+    with pdfplumber.open(pdf_source) as pdf:
+        return [_page_text(page) for page in pdf.pages[start:stop]]
+
+
+def _pdfminer_page_texts(pdf_source: Union[str, Path, BinaryIO], row_tolerance: float = 3) -> List[str]:
+    """
+    Extract the text of every page with pdfminer.six directly, skipping pdfplumber's
+    per-character objects. pdfminer returns text boxes rather than rows, so text lines whose
+    tops are within row_tolerance points of each other are joined left to right into one row,
+    which reproduces the row-per-line output of pdfplumber's extract_text.
+
+    Args:
+        pdf_source: Path to PDF file or binary file object
+        row_tolerance: Maximum vertical distance (in points) between lines of the same row
+
+    Returns:
+        Page texts in page order ("" for pages without text)
+    """
+    page_texts = []
+    for page in extract_pages(pdf_source, laparams=LAParams()):
+        lines = [
+            (line.y1, line.x0, text)
+            for element in page if isinstance(element, LTTextContainer)
+            for line in element if isinstance(line, LTTextLine)
+            for text in (line.get_text().strip(),) if text
+        ]
+        lines.sort(key=lambda line: (-line[0], line[1]))
+
+        rows = []
+        for top, x0, text in lines:
+            if rows and rows[-1][0] - top <= row_tolerance:
+                rows[-1][1].append((x0, text))
+            else:
+                rows.append((top, [(x0, text)]))
+        page_texts.append("\n".join(" ".join(text for _, text in sorted(row)) for _, row in rows))
+    return page_texts
+
+
+def _pdfium_page_texts(pdf_source: Union[str, Path, BinaryIO]) -> List[str]:
+    """
+    Extract the text of every page with PDFium (pypdfium2), whose text extraction runs in C++
+    without building any Python layout objects. PDFium already emits one line per row, but
+    with CRLF line breaks, which are normalized to "\n".
+
+    Args:
+        pdf_source: Path to PDF file or binary file object
+
+    Returns:
+        Page texts in page order ("" for pages without text)
+    """
+    page_texts = []
+    pdf = pdfium.PdfDocument(pdf_source)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                page_texts.append(textpage.get_text_bounded().replace('\r\n', '\n'))
+            finally:
+                # Free the native page objects right away rather than at garbage collection
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+    return page_texts
+
+
+# Text engines besides pdfplumber (the default, which also serves as their fallback)
+_TEXT_ENGINE_FUNCS = {
+    "pdfminer": _pdfminer_page_texts,
+    "pdfium": _pdfium_page_texts,
+}
+
+
 class TradingDataExtractor:
     """
     Extracts trading data from congressional disclosure PDFs.
     """
 
-    # Configuration constants
-    OWNER_CODES = {
-        "SP": "Spouse",
-        "DC": "Dependent Child", 
-        "JT": "Joint"
-    }
-    
-    AMOUNT_RANGES = [
-        (15000, "$1,001 - $15,000"),
-        (50000, "$15,001 - $50,000"),
-        (100000, "$50,001 - $100,000"),
-        (250000, "$100,001 - $250,000"),
-        (500000, "$250,001 - $500,000"),
-        (1000000, "$500,001 - $1,000,000"),
-        (5000000, "$1,000,001 - $5,000,000"),
-        (25000000, "$5,000,001 - $25,000,000"),
-        (50000000, "$25,000,001 - $50,000,000"),
-        (100000000, "Over $50,000,000")
-    ]
-    
-    def __init__(self):
+    # Configuration constants (the per-line code uses the module-level tables directly)
+    OWNER_CODES = _OWNER_CODES
+    AMOUNT_RANGES = _AMOUNT_RANGES
+
+    # Download settings
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    PDF_MAGIC = b"%PDF"
+    HTTP_POOL_SIZE = 16
+
+    # Smallest filing for which page text is extracted in the page pool
+    PAGE_POOL_MIN_PAGES = 8
+
+    # Libraries that can extract the page text
+    TEXT_ENGINES = ("pdfplumber", "pdfminer", "pdfium")
+
+    def __init__(self, page_workers: Optional[int] = None, text_engine: Optional[str] = None):
+        """
+        Args:
+            page_workers: Number of processes used to extract the pages of large filings in
+                parallel (defaults to EXTRACT_PAGE_WORKERS; 0 or 1 extracts pages in order)
+            text_engine: One of TEXT_ENGINES (defaults to PDF_TEXT_ENGINE, or "pdfplumber").
+                Other engines fall back to pdfplumber for PDFs they can't read; the page pool
+                is only used with pdfplumber. "pdfium" needs pypdfium2 and falls back to
+                pdfplumber when it isn't installed.
+        """
         self.temp_dir = None
         self.pdf_url = None
+        self._session: Optional[requests.Session] = None
+        if page_workers is None:
+            page_workers = int(os.getenv("EXTRACT_PAGE_WORKERS", 0))
+        self.page_workers = page_workers
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        # The extractor can be shared by executor threads; only one may create the pool
+        self._page_pool_lock = threading.Lock()
+        text_engine = text_engine or os.getenv("PDF_TEXT_ENGINE", "pdfplumber")
+        if text_engine not in self.TEXT_ENGINES:
+            raise ValueError(f"Unknown PDF text engine: {text_engine}")
+        if text_engine == "pdfium" and pdfium is None:
+            print("pypdfium2 is not installed, using pdfplumber for PDF text")
+            text_engine = "pdfplumber"
+        self.text_engine = text_engine
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive HTTP session shared by all downloads, created on first use"""
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE, pool_maxsize=self.HTTP_POOL_SIZE)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
 
     def create_temp_dir(self):
         """Create temporary directory for PDF downloads"""
@@ -52,9 +278,16 @@ class TradingDataExtractor:
         return self.temp_dir
     
     def cleanup_temp_dir(self):
-        """Remove temporary directory and all files"""
+        """Remove temporary directory and all files, and close the HTTP session and page pool"""
         if self.temp_dir and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        with self._page_pool_lock:
+            if self._page_pool is not None:
+                self._page_pool.shutdown()
+                self._page_pool = None
 
     @retry(
         stop=stop_after_attempt(3),
@@ -65,17 +298,27 @@ class TradingDataExtractor:
         """Download PDF from URL to temp directory with retry logic"""
         if not self.temp_dir:
             self.create_temp_dir()
-            
+
         pdf_path = self.temp_dir / filename
         self.pdf_url = pdf_url
-        
+
         try:
-            response = requests.get(pdf_url, timeout=30)
-            response.raise_for_status()
-            
-            with open(pdf_path, 'wb') as f:
-                f.write(response.content)
-            
+            with self.session.get(pdf_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                chunks = response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE)
+                first_chunk = next(chunks, b"")
+
+                # Error pages come back as HTML with a 200 status, so check the magic bytes
+                if not first_chunk.startswith(self.PDF_MAGIC):
+                    print(f"Response from {pdf_url} is not a PDF")
+                    return None
+
+                with open(pdf_path, 'wb') as f:
+                    f.write(first_chunk)
+                    for chunk in chunks:
+                        f.write(chunk)
+
             # logger.info(f"Downloaded PDF: {filename}")
             return pdf_path
         except (requests.RequestException, requests.Timeout, ConnectionError) as e:
@@ -85,29 +328,71 @@ class TradingDataExtractor:
             # logger.error(f"Non-retryable error downloading {pdf_url}: {e}")
             return None
 
-    def _extract_member_info(self, first_page) -> Dict:
-        """Extract member information from first page"""
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type((requests.RequestException, requests.Timeout, ConnectionError))
+    )
+    def fetch_pdf(self, pdf_url: str) -> Optional[bytes]:
+        """Download PDF from URL into memory with retry logic (no temp file)"""
+        self.pdf_url = pdf_url
+
+        try:
+            with self.session.get(pdf_url, timeout=30) as response:
+                response.raise_for_status()
+                pdf_bytes = response.content
+
+            # Error pages come back as HTML with a 200 status, so check the magic bytes
+            if not pdf_bytes.startswith(self.PDF_MAGIC):
+                print(f"Response from {pdf_url} is not a PDF")
+                return None
+            return pdf_bytes
+        except (requests.RequestException, requests.Timeout, ConnectionError) as e:
+            raise  # Let tenacity handle the retry
+        except Exception as e:
+            return None
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError))
+    )
+    async def fetch_pdf_async(self, pdf_url: str, session: aiohttp.ClientSession) -> Optional[bytes]:
+        """Download PDF from URL into memory using a shared aiohttp session (no temp file)"""
+        try:
+            async with session.get(pdf_url) as response:
+                response.raise_for_status()
+                pdf_bytes = await response.read()
+
+            # Error pages come back as HTML with a 200 status, so check the magic bytes
+            if not pdf_bytes.startswith(self.PDF_MAGIC):
+                print(f"Response from {pdf_url} is not a PDF")
+                return None
+            return pdf_bytes
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise  # Let tenacity handle the retry
+        except Exception as e:
+            return None
+
+    def _extract_member_info(self, text: str) -> Dict:
+        """Extract member information from the text of the first page"""
         member_info = {}
         
-        if not first_page:
-            return member_info
-        
-        text = first_page.extract_text()
         if not text:
             return member_info
         
         # Extract filing ID
-        filing_id_match = re.search(r'Filing ID #(\d+)', text)
+        filing_id_match = _FILING_ID_RE.search(text)
         if filing_id_match:
             member_info['filing_id'] = filing_id_match.group(1)
         
         # Extract member name
-        name_match = re.search(r'Name: (.+?)(?:\n|Status:)', text)
+        name_match = _NAME_RE.search(text)
         if name_match:
             member_info['name'] = name_match.group(1).strip()
         
         # Extract district
-        district_match = re.search(r'State/District: (.+?)(?:\n|$)', text)
+        district_match = _DISTRICT_RE.search(text)
         if district_match:
             member_info['district'] = district_match.group(1).strip()
             
@@ -115,10 +400,10 @@ class TradingDataExtractor:
     
     def _is_transaction_line(self, line: str) -> bool:
         """Check if line contains stock transaction data"""
-        # print(line)
-        return (('P ' in line or 'S ' in line) and 
-                '$' in line and 
-                any(c.isdigit() for c in line))
+        # Cheapest and most selective check first; all of these scan the line in C
+        return ('$' in line and
+                ('P ' in line or 'S ' in line) and
+                not _DIGITS.isdisjoint(line))
     
     def _is_stock_transaction(self, line: str, context_lines: List[str]) -> bool:
         """Check if line is a stock transaction based on context"""
@@ -136,16 +421,16 @@ class TradingDataExtractor:
     def _get_context_lines(self, lines: List[str], index: int, context: int = 2) -> List[str]:
         """Get context lines around current line for asset name extraction"""
         # start = max(0, index - context)
-        start = index
-        end = min(len(lines), index + context + 1)
-        # print(lines[start:end])
-        return lines[start:end]
+        # Built once per candidate line and shared by the stock check and the parser; slicing
+        # already clamps the end to the number of lines
+        return lines[index:index + context + 1]
 
     def _extract_owner_code(self, line: str) -> Tuple[str, str]:
-        """Extract owner code from beginning of line"""
-        owner_match = re.match(r'^(SP|DC|JT)\s+(.+)', line)
-        if owner_match:
-            return owner_match.group(1), owner_match.group(2)
+        """Extract owner code (e.g. "SP") from beginning of line, if followed by whitespace and text"""
+        if line[:2] in _OWNER_CODES and line[2:3].isspace():
+            rest = line[3:].lstrip()
+            if rest:
+                return line[:2], rest
         return "", line
     
     def _get_transaction_type(self, line: str) -> str:
@@ -201,126 +486,105 @@ class TradingDataExtractor:
         if not asset_name:
             return ""
         
-        # Remove special characters and normalize whitespace
-        cleaned = re.sub(r'[^\w\s\.\-&(),]', ' ', asset_name)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        # Remove bracket annotations
-        cleaned = re.sub(r'\s*\[[A-Z]+\]\s*', '', cleaned)
-        
-        return cleaned
+        # Remove special characters and normalize whitespace in one pass
+        return _clean_asset_name_cached(asset_name)
 
     def _extract_asset_info(self, line: str, context_lines: List[str]) -> Tuple[str, str]:
         """Extract ticker and asset name from line and context"""
-        ticker_pattern = re.compile(r'\(([A-Z0-9.]+)\)')
-
-        ticker = ""
-        ticker_line_index = -1
-
         # Step 1: Find the ticker in context_lines
-        for i, context_line in enumerate(context_lines):
-            ticker_match = ticker_pattern.search(context_line)
+        for ticker_line_index, context_line in enumerate(context_lines):
+            ticker_match = _TICKER_RE.search(context_line)
             if ticker_match:
-                ticker = ticker_match.group(1)
-                ticker_line_index = i
                 break
-
-        if not ticker:
+        else:
             return "", ""
 
+        ticker = ticker_match.group(1)
+
         asset_lines = []
 
         for j in range(ticker_line_index):
             line_text = context_lines[j]
             if j == 0:
                 # Remove owner code first for the primary line
-                owner_match = re.match(r'^(SP|DC|JT)\s+(.+)', line_text)
-                if owner_match:
-                    line_text = owner_match.group(2)
+                _, line_text = self._extract_owner_code(line_text)
                 
                 # Then look for transaction markers and dates/amounts
                 # Find the first occurrence of P or S or E followed by space and date pattern
-                transaction_pattern = r'\s+[PSE]\s'
-                match = re.search(transaction_pattern, line_text)
+                match = _TRANSACTION_MARKER_RE.search(line_text)
                 if match:
                     line_text = line_text[:match.start()]
             else:
-                # Secondary cutoff markers (in overflow lines, looks for dates, financial amounts - e.g., "$1", "$ 1", "- $")
-                for pattern in [r'\d{2}/\d{2}/\d{4}', r'\$\d', r'\$\s*\d', r'-\s*\$']:
-                    match = re.search(pattern, line_text)
-                    if match:
-                        line_text = line_text[:match.start()]
-                        break
+                # Cut at the earliest secondary marker
+                match = _SECONDARY_CUTOFF_RE.search(line_text)
+                if match:
+                    line_text = line_text[:match.start()]
 
-            asset_lines.append(line_text.strip())
+            asset_lines.append(line_text)
 
-        # Process final ticker line for any asset name prefix
-        ticker_line_before_ticker = re.sub(rf'\s*\({re.escape(ticker)}\)\s*.*$', '', context_lines[ticker_line_index])
+        # Process final ticker line for any asset name prefix (everything before the ticker
+        # match from step 1)
+        ticker_line_before_ticker = context_lines[ticker_line_index][:ticker_match.start()]
         if ticker_line_index == 0:
             # Remove owner code first for the primary line. 
-            owner_match = re.match(r'^(SP|DC|JT)\s+(.+)', ticker_line_before_ticker)
-            if owner_match:
-                ticker_line_before_ticker = owner_match.group(2)
+            _, ticker_line_before_ticker = self._extract_owner_code(ticker_line_before_ticker)
                 
-        asset_lines.append(ticker_line_before_ticker.strip())
+        asset_lines.append(ticker_line_before_ticker)
 
+        # The pieces aren't stripped individually; cleaning collapses every whitespace run
+        # (including the joins) to one space and strips the ends in a single pass
         asset_name = ' '.join(asset_lines)
         return ticker, self._clean_asset_name(asset_name)
 
     def _extract_dates(self, line: str) -> List[str]:
         """Extract dates in MM/DD/YYYY format"""
-        return re.findall(r'\d{2}/\d{2}/\d{4}', line)
+        return _DATE_RE.findall(line)
     
     def _extract_and_categorize_amount(self, line: str) -> str:
         """Extract amount and convert to standard ranges"""
-        amount_match = re.search(r'\$[\d,]+', line)
+        amount_match = _AMOUNT_RE.search(line)
         if not amount_match:
             return ""
         
-        try:
-            # Convert to integer for range mapping
-            raw_amount = amount_match.group(0).replace('$', '').replace(',', '')
-            amount_value = int(raw_amount)
-            
-            # Map to fixed ranges
-            if amount_value < 1000:
-                return f"${amount_value:,}"  # Exact amount for < $1K
-            
-            for threshold, range_str in self.AMOUNT_RANGES:
-                if amount_value <= threshold:
-                    return range_str
-            
-            return "Over $50,000,000"
-            
-        except ValueError:
-            return amount_match.group(0)  # Fall back to raw match
+        # Lines are nearly all unique, but the amounts on them are not, so cache by amount
+        return _categorize_amount_cached(amount_match.group(0))
 
     def _parse_transaction_line(self, line: str, context_lines: List[str]) -> Optional[Dict]:
-        """Parse a single transaction line with context"""
+        """
+        Parse a candidate transaction line with context, or return None if it isn't a stock
+        transaction with the required fields. Checks run cheapest first, so most rejected
+        lines never reach the asset name extraction.
+        """
         try:
-            # Extract owner code and clean line
-            owner_code, line_without_owner = self._extract_owner_code(line)
-            
-            # Determine transaction type
-            transaction_type = self._get_transaction_type(line)
-            
-            # Extract ticker and asset name
-            ticker, asset_name = self._extract_asset_info(line, context_lines)
-            
+            # Only stock transactions
+            if not self._is_stock_transaction(line, context_lines):
+                return None
+
             # Extract dates
             dates = self._extract_dates(line)
+            if len(dates) < 2:
+                return None
             
             # Extract and categorize amount
             amount = self._extract_and_categorize_amount(line)
-            
-            # Validate required fields
-            if not asset_name or len(dates) < 2 or not amount:
+            if not amount:
+                return None
+
+            # Extract ticker and asset name
+            ticker, asset_name = self._extract_asset_info(line, context_lines)
+            if not asset_name:
                 return None
+
+            # Extract owner code
+            owner_code, _ = self._extract_owner_code(line)
+            
+            # Determine transaction type
+            transaction_type = self._get_transaction_type(line)
             
             return {
-                "asset": asset_name.strip(),
+                "asset": asset_name,
                 "ticker": ticker,
-                "owner": self.OWNER_CODES.get(owner_code, "Self"),
+                "owner": _OWNER_CODES.get(owner_code, "Self"),
                 "owner_code": owner_code,
                 "transaction_type": transaction_type,
                 "transaction_date": dates[0],
@@ -334,34 +598,61 @@ class TradingDataExtractor:
 
     def _extract_transactions_from_lines(self, lines: List[str]) -> List[Dict]:
         """Extract transactions from lines of text"""
-        transactions = []
-        
+        return list(self._iter_transactions_from_lines(lines))
+
+    def _iter_transactions_from_lines(self, lines: List[str]) -> Iterator[Dict]:
+        """Yield transactions from lines of text as they are parsed"""
         for i, line in enumerate(lines):
-            # Look for transaction lines with pattern: Asset P/S Date Date Amount
-            if self._is_transaction_line(line):
-                context_lines = self._get_context_lines(lines, i)
-                if self._is_stock_transaction(line, context_lines):
-                    transaction = self._parse_transaction_line(line, context_lines)
-                
-                    if transaction:
-                        transactions.append(transaction)
-            
-        return transactions
+            # Look for transaction lines with pattern: Asset P/S Date Date Amount. Most lines
+            # have no "$" at all, so rule those out inline before paying for a method call.
+            if '$' in line and self._is_transaction_line(line):
+                transaction = self._parse_transaction_line(line, self._get_context_lines(lines, i))
+                if transaction:
+                    yield transaction
     
-    def _extract_all_transactions(self, pages) -> List[Dict]:
-        """Extract transactions from all pages"""
+    def _extract_all_transactions(self, page_texts: Iterable[str]) -> List[Dict]:
+        """
+        Extract transactions from the texts of all pages, in page order. page_texts may be
+        a generator; each page's text and lines are released before the next page is read.
+        """
         all_transactions = []
         
-        for page in pages:
-            text = page.extract_text()
-            if not text:
+        for text in page_texts:
+            # Pages without a "$" (cover, asset-class and certification pages) can't hold a
+            # transaction line, so don't split them into lines at all
+            if not text or '$' not in text:
                 continue
             
+            # split('\n') rather than splitlines(): the context lookahead needs indexing, and
+            # splitlines() would also break on form feeds and other characters PDFs can contain
             lines = text.split('\n')
-            page_transactions = self._extract_transactions_from_lines(lines)
-            all_transactions.extend(page_transactions)
+            all_transactions.extend(self._iter_transactions_from_lines(lines))
         
         return all_transactions
+
+    def _submit_page_texts(self, pdf_source: Union[str, bytes], page_count: int) -> List:
+        """
+        Split the pages of a PDF into one contiguous range per page worker and submit them
+        to the page pool.
+
+        Args:
+            pdf_source: Path to PDF file, or the PDF's bytes
+            page_count: Number of pages in the PDF
+
+        Returns:
+            Futures resolving to the page texts of each range, in page order
+        """
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = ProcessPoolExecutor(max_workers=self.page_workers,
+                                                      mp_context=pool_mp_context())
+            page_pool = self._page_pool
+
+        step = -(-page_count // self.page_workers)
+        return [
+            page_pool.submit(_extract_page_texts, pdf_source, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
     
     # def _remove_duplicates(self, transactions: List[Dict]) -> List[Dict]:
     #     """Remove duplicate transactions"""
@@ -385,52 +676,107 @@ class TradingDataExtractor:
         
     #     return unique_transactions
     
-    def _build_result(self, member_info: Dict, transactions: List[Dict], pdf_path: Path) -> Dict:
+    def _build_result(self, member_info: Dict, transactions: List[Dict], pdf_path: Path,
+                      pdf_url: Optional[str] = None) -> Dict:
         """Build successful result dictionary"""
         return {
             "member_info": member_info,
-            "pdf_url": self.pdf_url,
+            "pdf_url": pdf_url or self.pdf_url,
             "transactions": transactions,
             "parsed_at": datetime.now().isoformat()
         }
     
-    def _build_error_result(self, error: Exception, pdf_path: Path) -> Dict:
+    def _build_error_result(self, error: Exception, pdf_path: Path,
+                            pdf_url: Optional[str] = None) -> Dict:
         """Build error result dictionary"""
         return {
             "error": str(error),
             "member_info": {},
-            "pdf_url": self.pdf_url,
+            "pdf_url": pdf_url or self.pdf_url,
             "transactions": [],
             "parsed_at": datetime.now().isoformat()
         }
        
-    def extract_trading_data(self, pdf_path: Path) -> Dict:
+    def _iter_page_texts(self, pdf_path: Union[Path, BinaryIO]) -> Iterator[str]:
+        """
+        Extract the text of every page with the configured text engine (in the page pool
+        for large filings). With pdfplumber, pages are read one at a time as the generator
+        is consumed and their layout objects are freed right after, so a long filing never
+        holds every page's characters at once.
+
+        Args:
+            pdf_path: Path to PDF file or binary file object
+
+        Yields:
+            Page texts in page order ("" for pages without text)
+        """
+        engine_page_texts = _TEXT_ENGINE_FUNCS.get(self.text_engine)
+        if engine_page_texts is not None:
+            try:
+                # Read fully before yielding anything, so a failure can still fall back
+                page_texts = engine_page_texts(pdf_path)
+            except Exception as e:
+                print(f"{self.text_engine} couldn't read the PDF, falling back to pdfplumber: {e}")
+                if hasattr(pdf_path, "seek"):
+                    pdf_path.seek(0)
+            else:
+                yield from page_texts
+                return
+
+        with pdfplumber.open(pdf_path) as pdf:
+            if self.page_workers > 1 and len(pdf.pages) >= self.PAGE_POOL_MIN_PAGES:
+                if hasattr(pdf_path, "read"):
+                    pdf_path.seek(0)
+                    pdf_source = pdf_path.read()
+                else:
+                    pdf_source = str(pdf_path)
+                futures = self._submit_page_texts(pdf_source, len(pdf.pages))
+                for future in futures:
+                    yield from future.result()
+                return
+
+            for page in pdf.pages:
+                yield _page_text(page)
+
+    def extract_trading_data(self, pdf_path: Union[Path, bytes, BinaryIO],
+                             pdf_url: Optional[str] = None) -> Dict:
         """
         Main extraction method - orchestrates the process.
         
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF file, or the PDF itself as bytes or a binary file object
+                (e.g. from fetch_pdf), which is parsed in memory
+            pdf_url: Source URL of the PDF (defaults to the last downloaded URL)
             
         Returns:
             Dictionary with member_info, transactions, and metadata
         """
+        if isinstance(pdf_path, (bytes, bytearray)):
+            pdf_path = BytesIO(pdf_path)
+
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            # Layout analysis is the expensive part, so extract each page's text exactly
+            # once, streaming the pages through the steps below
+            page_texts = self._iter_page_texts(pdf_path)
+            try:
                 # Extract member information from first page
-                member_info = self._extract_member_info(pdf.pages[0] if pdf.pages else None)
+                first_page_text = next(page_texts, "")
+                member_info = self._extract_member_info(first_page_text)
                 
                 # Extract all transactions from all pages
-                transactions = self._extract_all_transactions(pdf.pages)
-                
-                # Remove duplicates (Unnecessary)
-                # unique_transactions = self._remove_duplicates(transactions)
-                
-                # return self._build_result(member_info, unique_transactions, pdf_path)
-                return self._build_result(member_info, transactions, pdf_path)
+                transactions = self._extract_all_transactions(chain((first_page_text,), page_texts))
+            finally:
+                page_texts.close()
+            
+            # Remove duplicates (Unnecessary)
+            # unique_transactions = self._remove_duplicates(transactions)
+            
+            # return self._build_result(member_info, unique_transactions, pdf_path)
+            return self._build_result(member_info, transactions, pdf_path, pdf_url)
                 
         except Exception as e:
             # logger.error(f"Error extracting data from {pdf_path}: {e}")
-            return self._build_error_result(e, pdf_path)
+            return self._build_error_result(e, pdf_path, pdf_url)
 
 def main():
     """Main function to test the trading data extractor"""